@@ -15,6 +15,11 @@ from cryptography.hazmat.primitives.asymmetric import ec, ed25519
 
 from app.config import Settings, get_settings
 
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    orjson = None
+
 
 COINBASE_API_BASE = "https://api.coinbase.com"
 
@@ -407,7 +412,10 @@ class CoinbaseClient:
         params: Optional[dict[str, Any]] = None,
         json_body: Optional[dict[str, Any]] = None,
     ) -> dict[str, Any]:
-        request = self._client.build_request(method, path, params=params, json=json_body)
+        if json_body and orjson is not None:
+            request = self._client.build_request(method, path, params=params, content=orjson.dumps(json_body))
+        else:
+            request = self._client.build_request(method, path, params=params, json=json_body)
         if json_body and "content-type" not in request.headers:
             request.headers["Content-Type"] = "application/json"
 
@@ -424,4 +432,6 @@ class CoinbaseClient:
         response = await self._client.send(request)
         if response.status_code >= 400:
             raise CoinbaseAPIError(response.status_code, response.text)
+        if orjson is not None:
+            return orjson.loads(response.content)
         return response.json()
@@ -6,6 +6,7 @@ from enum import Enum
 from datetime import datetime, timezone
 from decimal import Decimal
 import logging
+import sys
 from typing import Any, Optional, Sequence
 
 from sqlalchemy.orm import Session
@@ -17,6 +18,7 @@ from app.coinbase.validators import (
     ensure_min_size,
     enforce_min_distance,
     enforce_stop_distance,
+    min_distance_threshold,
     round_price,
     round_stop_price,
 )
@@ -26,6 +28,9 @@ from app.db.models import OrderSide, OrderStatus
 
 logger = logging.getLogger(__name__)
 
+# Python 3.11+ parses a trailing "Z" (and >6 fractional digits) natively.
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
 
 class OrderType(str, Enum):
     LIMIT = "limit"
@@ -95,9 +100,14 @@ class ExecutionService:
         if self.constraints is None:
             raise ValueError("Product constraints must be provided before placing orders")
 
+        # Per-call invariants: the constraints and mid-price threshold are the
+        # same for every order in the batch.
+        constraints = self.constraints
+        threshold = min_distance_threshold(mid_price, constraints)
+
         validated: list[PlannedOrder] = []
         for order in planned_orders:
-            size = ensure_min_size(order.base_size, self.constraints)
+            size = ensure_min_size(order.base_size, constraints)
 
             if order.order_type == OrderType.MARKET:
                 if order.stop_price is not None:
@@ -125,9 +135,9 @@ class ExecutionService:
                 if order.stop_price is None:
                     raise ValueError("Stop price must be provided for stop-limit orders")
 
-                stop_price = round_stop_price(order.stop_price, self.constraints, order.side)
-                limit_price = round_price(order.limit_price, self.constraints, order.side)
-                enforce_stop_distance(stop_price, mid_price, self.constraints, order.side)
+                stop_price = round_stop_price(order.stop_price, constraints, order.side)
+                limit_price = round_price(order.limit_price, constraints, order.side)
+                enforce_stop_distance(stop_price, mid_price, constraints, order.side, threshold=threshold)
 
                 if order.side == OrderSide.BUY and limit_price < stop_price:
                     raise ValueError("Buy stop-limit orders require limit price ≥ stop price")
@@ -153,11 +163,11 @@ class ExecutionService:
                 if order.stop_price is None:
                     raise ValueError("Trigger bracket orders require a stop price")
 
-                stop_price = round_stop_price(order.stop_price, self.constraints, order.side)
-                limit_price = round_price(order.limit_price, self.constraints, order.side)
+                stop_price = round_stop_price(order.stop_price, constraints, order.side)
+                limit_price = round_price(order.limit_price, constraints, order.side)
 
-                enforce_min_distance(limit_price, mid_price, self.constraints, order.side)
-                enforce_stop_distance(stop_price, mid_price, self.constraints, order.side)
+                enforce_min_distance(limit_price, mid_price, constraints, order.side, threshold=threshold)
+                enforce_stop_distance(stop_price, mid_price, constraints, order.side, threshold=threshold)
 
                 if stop_price >= limit_price:
                     raise ValueError("Trigger bracket orders require limit price above stop price")
@@ -175,8 +185,8 @@ class ExecutionService:
                 )
                 continue
 
-            price = round_price(order.limit_price, self.constraints, order.side)
-            enforce_min_distance(price, mid_price, self.constraints, order.side)
+            price = round_price(order.limit_price, constraints, order.side)
+            enforce_min_distance(price, mid_price, constraints, order.side, threshold=threshold)
             validated.append(
                 PlannedOrder(
                     side=order.side,
@@ -236,6 +246,14 @@ class ExecutionService:
         return payload
 
     async def sync_open_and_fills(self, session: Session, *, product_id: Optional[str] = None) -> SyncResult:
+        open_records, executed_records = await self.fetch_open_and_fills(product_id=product_id)
+        return self.store_open_and_fills(session, open_records, executed_records)
+
+    async def fetch_open_and_fills(
+        self, *, product_id: Optional[str] = None
+    ) -> tuple[list[crud.OpenOrderRecord], list[crud.ExecutedOrderRecord]]:
+        """Fetch orders and fills from Coinbase and build their records, without touching the DB."""
+
         product = product_id or self.product_id
         orders_payload = await self.client.list_orders(
             product_id=product,
@@ -265,8 +283,14 @@ class ExecutionService:
                 native_payload = None
         if native_payload is None:
             open_records, executed_records = _build_records_python(orders_payload, fills_payload, product)
+        return open_records, executed_records
 
-
+    def store_open_and_fills(
+        self,
+        session: Session,
+        open_records: list[crud.OpenOrderRecord],
+        executed_records: list[crud.ExecutedOrderRecord],
+    ) -> SyncResult:
         crud.replace_open_orders(session, open_records)
         changed_ids = crud.upsert_executed_orders(session, executed_records)
         return SyncResult(
@@ -498,7 +522,8 @@ def _build_records_python(
 def parse_datetime(value: Optional[str]) -> Optional[datetime]:
     if not value:
         return None
-    value = value.replace("Z", "+00:00")
+    if not _FROMISOFORMAT_ACCEPTS_Z and value.endswith("Z"):
+        value = value[:-1] + "+00:00"
     try:
         return datetime.fromisoformat(value)
     except ValueError:
@@ -57,8 +57,20 @@ def ensure_min_size(size: Decimal, constraints: ProductConstraints) -> Decimal:
     return rounded_size
 
 
-def enforce_min_distance(price: Decimal, mid_price: Decimal, constraints: ProductConstraints, side: OrderSide) -> None:
-    threshold = mid_price * constraints.min_distance_pct
+def min_distance_threshold(mid_price: Decimal, constraints: ProductConstraints) -> Decimal:
+    return mid_price * constraints.min_distance_pct
+
+
+def enforce_min_distance(
+    price: Decimal,
+    mid_price: Decimal,
+    constraints: ProductConstraints,
+    side: OrderSide,
+    *,
+    threshold: Decimal | None = None,
+) -> None:
+    if threshold is None:
+        threshold = min_distance_threshold(mid_price, constraints)
     if side == OrderSide.BUY and mid_price - price < threshold:
         raise ValueError("Buy order does not satisfy minimum distance from mid-price")
     if side == OrderSide.SELL and price - mid_price < threshold:
@@ -84,10 +96,18 @@ def round_stop_price(price: Decimal, constraints: ProductConstraints, side: Orde
     return rounded.quantize(increment)
 
 
-def enforce_stop_distance(stop_price: Decimal, mid_price: Decimal, constraints: ProductConstraints, side: OrderSide) -> None:
+def enforce_stop_distance(
+    stop_price: Decimal,
+    mid_price: Decimal,
+    constraints: ProductConstraints,
+    side: OrderSide,
+    *,
+    threshold: Decimal | None = None,
+) -> None:
     """Ensure the stop trigger sits the required distance away from the mid price."""
 
-    threshold = mid_price * constraints.min_distance_pct
+    if threshold is None:
+        threshold = min_distance_threshold(mid_price, constraints)
     if side == OrderSide.BUY and stop_price - mid_price < threshold:
         raise ValueError("Buy stop does not satisfy minimum distance above mid-price")
     if side == OrderSide.SELL and mid_price - stop_price < threshold:
@@ -18,6 +18,8 @@ from app.db.session import session_scope
 MAKER_FEE_RATE = Decimal("0.0015")
 TAKER_FEE_RATE = Decimal("0.0025")
 CUTOFF_TS = datetime(2025, 9, 1, tzinfo=timezone.utc)
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_CUTOFF_TIMESTAMP_US = (CUTOFF_TS - _EPOCH) // timedelta(microseconds=1)
 
 logger = logging.getLogger("dashboard.pnl")
 
@@ -176,7 +178,7 @@ def _summarise_trades_native(
     *,
     now: datetime,
 ) -> Optional[dict[str, Any]]:
-    if not pnl_native.native_available():
+    if not pnl_native.summarise_available():
         return None
     payload = [_trade_to_native(trade) for trade in trades]
     if not payload:
@@ -188,7 +190,7 @@ def _summarise_trades_native(
         payload,
         list(_native_interval_specs()),
         now_timestamp_us=_to_microseconds(now),
-        cutoff_timestamp_us=_to_microseconds(CUTOFF_TS),
+        cutoff_timestamp_us=_CUTOFF_TIMESTAMP_US,
         maker_fee_rate=str(MAKER_FEE_RATE),
         taker_fee_rate=str(TAKER_FEE_RATE),
     )
@@ -215,9 +217,7 @@ def _native_interval_specs() -> Iterable[Mapping[str, Any]]:
 
 
 def _to_microseconds(ts: datetime) -> int:
-    aware = _ensure_aware(ts)
-    epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
-    delta = aware - epoch
+    delta = _ensure_aware(ts) - _EPOCH
     return delta.days * 86_400_000_000 + delta.seconds * 1_000_000 + delta.microseconds
 
 
@@ -5,11 +5,16 @@ from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from typing import Any, Iterable, Optional, Sequence
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, insert, select, update
 from sqlalchemy.orm import Session
 
 from app.db import models
 
+# Built once against the tables; the hot single-row inserts skip the ORM unit of work.
+_INSERT_RUN_LOG = insert(models.RunLog.__table__)
+_INSERT_PORTFOLIO_SNAPSHOT = insert(models.PortfolioSnapshot.__table__)
+_INSERT_PRICE_SNAPSHOT = insert(models.PriceSnapshot.__table__)
+
 
 @dataclass(slots=True)
 class PromptRecord:
@@ -98,6 +103,13 @@ def log_run_start(session: Session, kind: models.RunKind, *, usage_json: Optiona
     return run
 
 
+def log_run_start_fast(session: Session, kind: models.RunKind, *, usage_json: Optional[dict[str, Any]] = None) -> int:
+    """Like ``log_run_start`` but as a single Core INSERT; returns only the new row id."""
+
+    result = session.execute(_INSERT_RUN_LOG, {"kind": kind, "usage_json": usage_json})
+    return result.inserted_primary_key[0]
+
+
 def log_run_finish(
     session: Session,
     run: models.RunLog,
@@ -117,6 +129,25 @@ def log_run_finish(
     return run
 
 
+def log_run_finish_by_id(
+    session: Session,
+    run_id: int,
+    *,
+    status: models.RunStatus = models.RunStatus.SUCCESS,
+    error_text: Optional[str] = None,
+    usage_json: Optional[dict[str, Any]] = None,
+) -> bool:
+    """Like ``log_run_finish`` but as a single UPDATE, without loading the row first."""
+
+    values: dict[str, Any] = {"status": status, "finished_at": datetime.now(timezone.utc)}
+    if error_text:
+        values["error_text"] = error_text
+    if usage_json is not None:
+        values["usage_json"] = usage_json
+    result = session.execute(update(models.RunLog).where(models.RunLog.id == run_id).values(**values))
+    return bool(result.rowcount)
+
+
 def save_prompt_history(
     session: Session,
     kind: models.RunKind,
@@ -280,6 +311,12 @@ def record_portfolio_snapshot(session: Session, record: PortfolioSnapshotRecord)
     return snapshot
 
 
+def record_portfolio_snapshot_fast(session: Session, record: PortfolioSnapshotRecord) -> None:
+    """Like ``record_portfolio_snapshot`` but as a single Core INSERT that returns nothing."""
+
+    session.execute(_INSERT_PORTFOLIO_SNAPSHOT, [{"ts": record.ts, "balances_json": record.balances_json}])
+
+
 def record_price_snapshot(session: Session, record: PriceSnapshotRecord) -> models.PriceSnapshot:
     snapshot = models.PriceSnapshot(
         ts=record.ts,
@@ -293,6 +330,23 @@ def record_price_snapshot(session: Session, record: PriceSnapshotRecord) -> mode
     return snapshot
 
 
+def record_price_snapshot_fast(session: Session, record: PriceSnapshotRecord) -> None:
+    """Like ``record_price_snapshot`` but as a single Core INSERT that returns nothing."""
+
+    session.execute(
+        _INSERT_PRICE_SNAPSHOT,
+        [
+            {
+                "ts": record.ts,
+                "product_id": record.product_id,
+                "best_bid": record.best_bid,
+                "best_ask": record.best_ask,
+                "mid": record.mid,
+            }
+        ],
+    )
+
+
 def upsert_pnl_trades(session: Session, trades: Sequence[PnLTradeRecord]) -> int:
     inserted = 0
     for trade in trades:
@@ -371,6 +425,11 @@ def latest_daily_plan(session: Session) -> Optional[models.DailyPlan]:
     return session.scalars(statement).first()
 
 
+def latest_daily_plan_text(session: Session) -> Optional[str]:
+    statement = select(models.DailyPlan.raw_text).order_by(models.DailyPlan.ts.desc()).limit(1)
+    return session.scalars(statement).first()
+
+
 def latest_two_hour_plan(session: Session) -> Optional[models.TwoHourPlan]:
     statement = select(models.TwoHourPlan).order_by(models.TwoHourPlan.ts.desc()).limit(1)
     return session.scalars(statement).first()
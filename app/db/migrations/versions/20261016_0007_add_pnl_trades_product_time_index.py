@@ -0,0 +1,23 @@
+"""Add composite (product_id, trade_time) index on pnl_trades."""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261016_0007"
+down_revision = "20251020_0006"
+branch_labels = None
+depends_on = None
+
+
+INDEX_NAME = "ix_pnl_trades_product_id_trade_time"
+
+
+def upgrade() -> None:
+    op.create_index(INDEX_NAME, "pnl_trades", ["product_id", "trade_time"])
+
+
+def downgrade() -> None:
+    op.drop_index(INDEX_NAME, table_name="pnl_trades")
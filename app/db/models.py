@@ -5,7 +5,7 @@ from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Any, Optional
 
-from sqlalchemy import Boolean, DateTime, Enum, Integer, JSON, Numeric, String, Text
+from sqlalchemy import Boolean, DateTime, Enum, Index, Integer, JSON, Numeric, String, Text
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -166,6 +166,7 @@ class DailyPlan(Base):
 
 class PnLTrade(Base):
     __tablename__ = "pnl_trades"
+    __table_args__ = (Index("ix_pnl_trades_product_id_trade_time", "product_id", "trade_time"),)
 
     fill_id: Mapped[str] = mapped_column(String(120), primary_key=True)
     order_id: Mapped[Optional[str]] = mapped_column(String(100), nullable=True, index=True)
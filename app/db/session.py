@@ -2,12 +2,17 @@ from __future__ import annotations
 
 from collections.abc import Generator
 from contextlib import contextmanager
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
 
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    orjson = None
+
 if TYPE_CHECKING:
     from app.config import Settings
 
@@ -15,6 +20,11 @@ _ENGINE: Engine | None = None
 _SESSION_FACTORY: sessionmaker[Session] | None = None
 
 
+def _orjson_serializer(value: Any) -> str:
+    # Same output shape as json.dumps for the payloads we store (str keys, numbers, ISO datetimes).
+    return orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS).decode()
+
+
 def get_engine(settings: "Settings" | None = None) -> Engine:
     global _ENGINE
 
@@ -26,7 +36,9 @@ def get_engine(settings: "Settings" | None = None) -> Engine:
 
         settings = get_settings()
     database_url = settings.database_url
-    create_kwargs = {"future": True, "pool_pre_ping": True}
+    create_kwargs: dict[str, Any] = {"future": True, "pool_pre_ping": True}
+    if orjson is not None:
+        create_kwargs["json_serializer"] = _orjson_serializer
     if database_url.startswith("sqlite"):
         create_kwargs["connect_args"] = {"check_same_thread": False}
     _ENGINE = create_engine(database_url, **create_kwargs)
@@ -1,4 +1,4 @@
-from app.llm.client import LLMClient, LLMResult
+from app.llm.client import LLMClient, LLMClientPool, LLMResult
 from app.llm.prompts import (
     MODEL_1_SYSTEM_PROMPT,
     MODEL_2_SYSTEM_PROMPT,
@@ -11,12 +11,13 @@ from app.llm.prompts import (
     build_model2_user_prompt,
     build_model3_user_prompt,
 )
-from app.llm.schemas import MODEL3_JSON_SCHEMA, Model3Order, Model3Response
+from app.llm.schemas import MODEL3_JSON_SCHEMA, MODEL3_TEXT_FORMAT, Model3Order, Model3Response
 from app.llm.summariser import summarise_to_500_words
 from app.llm.usage import UsageRecord, UsageTracker
 
 __all__ = [
     "LLMClient",
+    "LLMClientPool",
     "LLMResult",
     "MODEL_1_SYSTEM_PROMPT",
     "MODEL_2_SYSTEM_PROMPT",
@@ -29,6 +30,7 @@ __all__ = [
     "build_model2_user_prompt",
     "build_model3_user_prompt",
     "MODEL3_JSON_SCHEMA",
+    "MODEL3_TEXT_FORMAT",
     "Model3Order",
     "Model3Response",
     "summarise_to_500_words",
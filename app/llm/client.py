@@ -1,22 +1,35 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
-from typing import Any, Optional
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Iterator, Optional
 
 from openai import AsyncOpenAI
+from pydantic import ValidationError
 
 from app.config import Settings, get_settings
 from app.llm import prompts
 from app.llm.prompts import Model1Context, Model2Context, Model3Context
-from app.llm.schemas import MODEL3_JSON_SCHEMA, Model3Response
-from app.llm.usage import UsageTracker
+from app.llm.schemas import MODEL3_TEXT_FORMAT, Model3Response
+from app.llm.usage import UsageTracker, _response_to_dict
 
 
 @dataclass(slots=True)
 class LLMResult:
     text: str
     response: dict[str, Any]
+    prompt_text: str = ""
+    sources: Optional[list[Any]] = field(init=False, default=None)
+
+    def __post_init__(self) -> None:
+        # Pull the Responses API output list out once, when the response arrives.
+        if not self.response:
+            return
+        output = self.response.get("output") or self.response.get("outputs")
+        if output:
+            self.sources = output if isinstance(output, list) else [output]
 
 
 def _extract_output_text(response: Any) -> str:
@@ -60,22 +73,7 @@ def _extract_output_text(response: Any) -> str:
     return str(response)
 
 
-def _response_to_dict(response: Any) -> dict[str, Any]:
-    if response is None:
-        return {}
-    if isinstance(response, dict):
-        return response
-    model_dump = getattr(response, "model_dump", None)
-    if callable(model_dump):
-        return model_dump()
-    result: dict[str, Any] = {}
-    for attr in ("model", "usage", "output", "output_text"):
-        if hasattr(response, attr):
-            result[attr] = getattr(response, attr)
-    return result
-
-
-def _extract_json_payload(response: Any) -> Optional[dict[str, Any]]:
+def _iter_json_payloads(response: Any) -> Iterator[dict[str, Any] | str]:
     candidates: list[Any] = []
     for attr in ("output", "outputs"):
         if hasattr(response, attr):
@@ -99,15 +97,10 @@ def _extract_json_payload(response: Any) -> Optional[dict[str, Any]]:
                 if part.get("json") is not None:
                     payload = part.get("json")
                     if isinstance(payload, dict):
-                        return payload
-                    if isinstance(payload, str):
-                        try:
-                            decoded = json.loads(payload)
-                        except json.JSONDecodeError:
-                            continue
-                        if isinstance(decoded, dict):
-                            return decoded
-    return None
+                        yield payload
+                    elif isinstance(payload, str) and payload.lstrip().startswith("{"):
+                        # Decoded by pydantic-core in _parse_model3_json_part.
+                        yield payload
 
 
 class LLMClient:
@@ -118,7 +111,7 @@ class LLMClient:
         usage_tracker: Optional[UsageTracker] = None,
     ) -> None:
         self.settings = settings or get_settings()
-        self.usage = usage_tracker or UsageTracker()
+        self.usage = usage_tracker if usage_tracker is not None else UsageTracker()
         self._stub_mode = getattr(self.settings, "llm_stub_mode", False)
         self._client = AsyncOpenAI(api_key=self.settings.openai_api_key)
 
@@ -132,59 +125,62 @@ class LLMClient:
         await self.close()
 
     async def run_model1(self, context: Model1Context) -> LLMResult:
+        prompt_text = prompts.build_model1_user_prompt(context)
         if self._stub_mode:
-            return LLMResult(text="Stub Daily Plan", response={"stub": True})
+            return LLMResult(text="Stub Daily Plan", response={"stub": True}, prompt_text=prompt_text)
         response = await self._client.responses.create(
             model=self.settings.openai_responses_model_m1,
             input=[
                 {"role": "system", "content": prompts.MODEL_1_SYSTEM_PROMPT},
-                {"role": "user", "content": prompts.build_model1_user_prompt(context)},
+                {"role": "user", "content": prompt_text},
             ],
             tools=[{"type": "web_search"}],
             reasoning={"effort": self.settings.openai_responses_reasoning_m1},
         )
         self.usage.add_response(response)
-        return LLMResult(text=_extract_output_text(response), response=_response_to_dict(response))
+        return LLMResult(
+            text=_extract_output_text(response),
+            response=_response_to_dict(response),
+            prompt_text=prompt_text,
+        )
 
     async def run_model2(self, context: Model2Context) -> LLMResult:
+        prompt_text = prompts.build_model2_user_prompt(context)
         if self._stub_mode:
-            return LLMResult(text="Stub Model 2 Output", response={"stub": True})
+            return LLMResult(text="Stub Model 2 Output", response={"stub": True}, prompt_text=prompt_text)
         response = await self._client.responses.create(
             model=self.settings.openai_responses_model_m2,
             input=[
                 {"role": "system", "content": prompts.MODEL_2_SYSTEM_PROMPT},
-                {"role": "user", "content": prompts.build_model2_user_prompt(context)},
+                {"role": "user", "content": prompt_text},
             ],
             reasoning={"effort": self.settings.openai_responses_reasoning_m2},
         )
         self.usage.add_response(response)
-        return LLMResult(text=_extract_output_text(response), response=_response_to_dict(response))
+        return LLMResult(
+            text=_extract_output_text(response),
+            response=_response_to_dict(response),
+            prompt_text=prompt_text,
+        )
 
     async def run_model3(self, context: Model3Context) -> Model3Response:
         if self._stub_mode:
             return Model3Response.model_validate({"orders": []})
 
-        text_format = {
-            "format": {
-                "type": "json_schema",
-                "name": "model3_response",
-                "schema": MODEL3_JSON_SCHEMA,
-                "strict": True,
-            }
-        }
         response = await self._client.responses.create(
             model=self.settings.openai_responses_model_m3,
             input=[
                 {"role": "system", "content": prompts.MODEL_3_SYSTEM_PROMPT},
                 {"role": "user", "content": prompts.build_model3_user_prompt(context)},
             ],
-            text=text_format,
+            text=MODEL3_TEXT_FORMAT,
             reasoning={"effort": self.settings.openai_responses_reasoning_m3},
         )
         self.usage.add_response(response)
-        payload_json = _extract_json_payload(response)
-        if payload_json is not None:
-            return self._parse_model3_output(payload_json)
+        for payload_json in _iter_json_payloads(response):
+            parsed = self._parse_model3_json_part(payload_json)
+            if parsed is not None:
+                return parsed
         payload_text = _extract_output_text(response)
         return self._parse_model3_output(payload_text)
 
@@ -203,6 +199,17 @@ class LLMClient:
         self.usage.add_response(response)
         return _extract_output_text(response)
 
+    def _parse_model3_json_part(self, payload: dict[str, Any] | str) -> Optional[Model3Response]:
+        if isinstance(payload, dict):
+            return Model3Response.model_validate(payload)
+        try:
+            return Model3Response.model_validate_json(payload)
+        except ValidationError as exc:
+            # Malformed JSON falls through to the next candidate; schema errors still raise.
+            if any(error["type"] == "json_invalid" for error in exc.errors()):
+                return None
+            raise
+
     def _parse_model3_output(self, raw: Any) -> Model3Response:
         if isinstance(raw, dict):
             return Model3Response.model_validate(raw)
@@ -216,3 +223,30 @@ class LLMClient:
             except json.JSONDecodeError as exc:
                 raise ValueError("Model 3 output is not valid JSON") from exc
             return Model3Response.model_validate(data)
+
+
+class LLMClientPool:
+    """Keep idle LLMClient instances warm so scheduled runs reuse their HTTP connections."""
+
+    def __init__(self, *, settings: Optional[Settings] = None, size: int = 2) -> None:
+        self.settings = settings or get_settings()
+        self.size = size
+        self._idle: deque[LLMClient] = deque()
+
+    @asynccontextmanager
+    async def acquire(self, *, usage_tracker: Optional[UsageTracker] = None) -> AsyncIterator[LLMClient]:
+        # Borrow and return happen without an await in between, so the event loop
+        # never hands the same client to two runs.
+        client = self._idle.pop() if self._idle else LLMClient(settings=self.settings)
+        client.usage = usage_tracker if usage_tracker is not None else UsageTracker()
+        try:
+            yield client
+        finally:
+            if len(self._idle) < self.size:
+                self._idle.append(client)
+            else:
+                await client.close()
+
+    async def close(self) -> None:
+        while self._idle:
+            await self._idle.pop().close()
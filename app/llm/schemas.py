@@ -9,6 +9,9 @@ from pydantic import BaseModel, ConfigDict, Field, field_validator, model_valida
 from app.coinbase.exec import OrderType, PlannedOrder
 from app.db.models import OrderSide
 
+_SIDE_MAP: dict[str, OrderSide] = {side.value: side for side in OrderSide}
+_TWO_HOURS = timedelta(hours=2)
+
 
 class Model3Order(BaseModel):
     model_config = ConfigDict(extra="forbid")
@@ -72,10 +75,10 @@ class Model3Response(BaseModel):
         return value
 
     def to_planned_orders(self, *, end_time: Optional[datetime] = None) -> list[PlannedOrder]:
-        end_time = end_time or datetime.now(timezone.utc) + timedelta(hours=2)
+        end_time = end_time or (datetime.now(timezone.utc) + _TWO_HOURS)
         return [
             PlannedOrder(
-                side=OrderSide(order.side),
+                side=_SIDE_MAP[order.side],
                 limit_price=order.limit_price,
                 base_size=order.base_size,
                 post_only=order.post_only if order.order_type == "limit" else False,
@@ -118,3 +121,12 @@ def _ensure_required_flags(schema: dict[str, Any]) -> None:
 
 MODEL3_JSON_SCHEMA = Model3Response.model_json_schema(ref_template="#/$defs/{model}")
 _ensure_required_flags(MODEL3_JSON_SCHEMA)
+
+MODEL3_TEXT_FORMAT: dict[str, Any] = {
+    "format": {
+        "type": "json_schema",
+        "name": "model3_response",
+        "schema": MODEL3_JSON_SCHEMA,
+        "strict": True,
+    }
+}
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from array import array
+from dataclasses import dataclass
 from typing import Any, Iterable, Optional
 
+from pydantic import BaseModel
+
 
 @dataclass(slots=True)
 class UsageRecord:
@@ -12,9 +15,40 @@ class UsageRecord:
     total_tokens: int
 
 
-@dataclass
 class UsageTracker:
-    records: list[UsageRecord] = field(default_factory=list)
+    """Accumulate LLM token usage column-wise.
+
+    ``records`` is a read-only snapshot built on demand (a tuple, so appending to it fails
+    loudly); add usage through ``add_response`` or ``merge``.
+    """
+
+    __slots__ = ("_models", "_input", "_output", "_total", "_input_tokens", "_output_tokens", "_total_tokens")
+
+    def __init__(self, records: Optional[Iterable[UsageRecord]] = None) -> None:
+        self._models: list[str] = []
+        self._input: array[int] = array("q")
+        self._output: array[int] = array("q")
+        self._total: array[int] = array("q")
+        self._input_tokens = 0
+        self._output_tokens = 0
+        self._total_tokens = 0
+        for record in records or ():
+            self._append(record.model, record.input_tokens, record.output_tokens, record.total_tokens)
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+    def __repr__(self) -> str:
+        return f"UsageTracker(records={list(self.records)!r})"
+
+    @property
+    def records(self) -> tuple[UsageRecord, ...]:
+        return tuple(
+            UsageRecord(model=model, input_tokens=input_tokens, output_tokens=output_tokens, total_tokens=total_tokens)
+            for model, input_tokens, output_tokens, total_tokens in zip(
+                self._models, self._input, self._output, self._total
+            )
+        )
 
     def add_response(self, response: Any) -> None:
         data = _response_to_dict(response)
@@ -25,53 +59,63 @@ class UsageTracker:
         total_tokens = int(usage.get("total_tokens") or input_tokens + output_tokens)
         if total_tokens == 0 and not usage:
             return
-        self.records.append(
-            UsageRecord(
-                model=model,
-                input_tokens=input_tokens,
-                output_tokens=output_tokens,
-                total_tokens=total_tokens,
-            )
-        )
+        self._append(model, input_tokens, output_tokens, total_tokens)
 
     def merge(self, other: "UsageTracker") -> None:
-        self.records.extend(other.records)
+        self._models.extend(other._models)
+        self._input.extend(other._input)
+        self._output.extend(other._output)
+        self._total.extend(other._total)
+        self._input_tokens += other._input_tokens
+        self._output_tokens += other._output_tokens
+        self._total_tokens += other._total_tokens
 
     def totals(self) -> dict[str, int]:
-        total_input = sum(record.input_tokens for record in self.records)
-        total_output = sum(record.output_tokens for record in self.records)
-        total = sum(record.total_tokens for record in self.records)
         return {
-            "input_tokens": total_input,
-            "output_tokens": total_output,
-            "total_tokens": total,
-            "requests": len(self.records),
+            "input_tokens": self._input_tokens,
+            "output_tokens": self._output_tokens,
+            "total_tokens": self._total_tokens,
+            "requests": len(self._models),
         }
 
     def to_json(self) -> list[dict[str, int | str]]:
         return [
             {
-                "model": record.model,
-                "input_tokens": record.input_tokens,
-                "output_tokens": record.output_tokens,
-                "total_tokens": record.total_tokens,
+                "model": model,
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "total_tokens": total_tokens,
             }
-            for record in self.records
+            for model, input_tokens, output_tokens, total_tokens in zip(
+                self._models, self._input, self._output, self._total
+            )
         ]
 
+    def _append(self, model: str, input_tokens: int, output_tokens: int, total_tokens: int) -> None:
+        self._models.append(model)
+        self._input.append(input_tokens)
+        self._output.append(output_tokens)
+        self._total.append(total_tokens)
+        self._input_tokens += input_tokens
+        self._output_tokens += output_tokens
+        self._total_tokens += total_tokens
+
 
 def _response_to_dict(response: Any) -> dict[str, Any]:
     if response is None:
         return {}
 
+    if isinstance(response, BaseModel):
+        return response.model_dump()
+
     if isinstance(response, dict):
         return response
 
     model_dump = getattr(response, "model_dump", None)
     if callable(model_dump):
-        return model_dump()
+        return dict(model_dump())
 
-    data = {}
+    data: dict[str, Any] = {}
     for attr in ("model", "usage", "output", "output_text"):
         if hasattr(response, attr):
             data[attr] = getattr(response, attr)
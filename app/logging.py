@@ -4,6 +4,11 @@ import sys
 from datetime import datetime
 from typing import Any, Dict
 
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    orjson = None
+
 
 class JSONFormatter(logging.Formatter):
     """Emit logs as structured JSON strings."""
@@ -31,7 +36,15 @@ class JSONFormatter(logging.Formatter):
 
 
 def json_dumps(payload: Dict[str, Any]) -> str:
-    """Serialize a dictionary to JSON without relying on external libraries."""
+    """Serialize a dictionary to compact JSON, using orjson when it is installed."""
+
+    if orjson is not None:
+        # numpy arrays in extras (e.g. PnL kernel output) serialise without a tolist() pass.
+        return orjson.dumps(
+            payload,
+            default=str,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        ).decode()
 
     from json import dumps
 
@@ -13,10 +13,18 @@ from app.logging import setup_logging
 from app.scheduler.jobs import register_jobs, router as scheduler_router
 from app.scheduler.orchestration import SchedulerOrchestrator
 
+SCHEDULER_MISFIRE_GRACE_SECONDS = 30
+
 
 def create_scheduler(settings: Settings) -> AsyncIOScheduler:
     scheduler = AsyncIOScheduler(timezone=settings.app_timezone)
-    scheduler.configure(job_defaults={"max_instances": settings.scheduler_max_instances})
+    scheduler.configure(
+        job_defaults={
+            "max_instances": settings.scheduler_max_instances,
+            "coalesce": True,
+            "misfire_grace_time": SCHEDULER_MISFIRE_GRACE_SECONDS,
+        }
+    )
 
     if settings.scheduler_jobstore_url:
         from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
@@ -27,14 +35,13 @@ def create_scheduler(settings: Settings) -> AsyncIOScheduler:
 
 
 def _handle_job_error(event: JobExecutionEvent) -> None:
-    if event.exception:
+    exception = event.exception
+    if exception:
         scheduler_logger = logging.getLogger("apscheduler.job")
         scheduler_logger.error(
             "scheduled job failed",
-            extra={
-                "job_id": event.job_id,
-                "exception": str(event.exception),
-            },
+            extra={"job_id": event.job_id},
+            exc_info=(type(exception), exception, exception.__traceback__),
         )
 
 
@@ -48,7 +55,9 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     scheduler = create_scheduler(settings)
     scheduler.add_listener(_handle_job_error, EVENT_JOB_ERROR)
     app.state.scheduler = scheduler
-    app.state.orchestrator = SchedulerOrchestrator(settings)
+    orchestrator = SchedulerOrchestrator(settings)
+    app.state.orchestrator = orchestrator
+    await orchestrator.startup()
     register_jobs(scheduler, app)
     scheduler.start()
 
@@ -57,6 +66,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     finally:
         if scheduler.running:
             scheduler.shutdown(wait=False)
+        await orchestrator.shutdown()
 
 
 app = FastAPI(lifespan=lifespan)
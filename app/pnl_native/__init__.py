@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any, Iterable, Mapping, Optional
+import logging
+from typing import Any, Callable, Iterable, Mapping, Optional, Sequence
 
 try:
     from ._pnl_rs import (  # type: ignore[attr-defined]
@@ -11,11 +12,40 @@ except ModuleNotFoundError:  # pragma: no cover - native module optional
     _summarise_trades = None
     _process_orders_and_fills = None
 
+logger = logging.getLogger(__name__)
+
+# The Numba fallback is imported on first use so numba's import and JIT cost stay off
+# application startup and test collection. ``False`` means "not attempted yet".
+_summarise_trades_jit: Any = False
+
+
+def _load_summarise_trades_jit() -> Optional[Callable[..., Optional[dict[str, Any]]]]:
+    global _summarise_trades_jit
+    if _summarise_trades_jit is False:
+        try:
+            from ._numba_fallback import summarise_trades as loaded
+        except Exception:  # pragma: no cover - numba optional, or broken against this numpy
+            logger.warning("Numba PnL fallback unavailable; using the Python reducer", exc_info=True)
+            loaded = None
+        _summarise_trades_jit = loaded
+    return _summarise_trades_jit
+
 
 def native_available() -> bool:
     return _summarise_trades is not None
 
 
+def summarise_available() -> bool:
+    return _summarise_trades is not None or _load_summarise_trades_jit() is not None
+
+
+def _as_sequence(items: Iterable[Any]) -> Sequence[Any]:
+    # The extension accepts any list/tuple directly; only copy generators and other iterables.
+    if isinstance(items, (list, tuple)):
+        return items
+    return list(items)
+
+
 def summarise_trades(
     trades: Iterable[Mapping[str, Any]],
     intervals: Iterable[Mapping[str, Any]],
@@ -25,11 +55,28 @@ def summarise_trades(
     maker_fee_rate: str,
     taker_fee_rate: str,
 ) -> Optional[dict[str, Any]]:
+    global _summarise_trades_jit
     if _summarise_trades is None:
-        return None
+        summarise_jit = _load_summarise_trades_jit()
+        if summarise_jit is None:
+            return None
+        try:
+            # The kernel compiles on its first call, so compile errors surface here too.
+            return summarise_jit(
+                trades,
+                intervals,
+                now_timestamp_us=now_timestamp_us,
+                cutoff_timestamp_us=cutoff_timestamp_us,
+                maker_fee_rate=maker_fee_rate,
+                taker_fee_rate=taker_fee_rate,
+            )
+        except Exception:
+            logger.exception("Numba PnL fallback failed; using the Python reducer from now on")
+            _summarise_trades_jit = None
+            return None
     return _summarise_trades(
-        list(trades),
-        list(intervals),
+        _as_sequence(trades),
+        _as_sequence(intervals),
         now_timestamp_us,
         cutoff_timestamp_us,
         maker_fee_rate,
@@ -45,4 +92,4 @@ def process_orders_and_fills(
 ) -> Optional[dict[str, Any]]:
     if _process_orders_and_fills is None:
         return None
-    return _process_orders_and_fills(list(orders), list(fills), product_id)
+    return _process_orders_and_fills(_as_sequence(orders), _as_sequence(fills), product_id)
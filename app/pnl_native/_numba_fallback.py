@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from decimal import Decimal
+from itertools import accumulate
+from typing import Any, Iterable, Mapping, Optional
+
+import numpy as np
+from numba import njit
+
+# Prices and sizes come from NUMERIC(18, 8) columns: scaled by 10**8 they are exact integers.
+_SCALE_DIGITS = 8
+_SCALE = 10**_SCALE_DIGITS
+
+
+@njit(cache=True)
+def _match_lots(sizes, sides):
+    n = sizes.shape[0]
+    # One FIFO book of lots in integer size units. Only one direction is ever open, so a
+    # trade with sign ``side`` closes lots of the opposite sign and opens the remainder.
+    lot_trade = np.empty(n, dtype=np.int64)
+    lot_size = np.empty(n, dtype=np.int64)
+    lot_side = np.empty(n, dtype=np.int8)
+    head = 0
+    tail = 0
+
+    # Every match either exhausts a lot or the trade, so there are at most 2n of them.
+    match_trade = np.empty(2 * n, dtype=np.int64)
+    match_lot = np.empty(2 * n, dtype=np.int64)
+    match_size = np.empty(2 * n, dtype=np.int64)
+    matches = 0
+
+    for i in range(n):
+        side = sides[i]
+        remaining = sizes[i]
+        while remaining > 0 and head < tail and lot_side[head] != side:
+            lot = lot_size[head]
+            matched = remaining if remaining <= lot else lot
+            match_trade[matches] = i
+            match_lot[matches] = lot_trade[head]
+            match_size[matches] = matched
+            matches += 1
+            lot_size[head] = lot - matched
+            remaining -= matched
+            if matched >= lot:
+                head += 1
+        if remaining > 0:
+            lot_trade[tail] = i
+            lot_size[tail] = remaining
+            lot_side[tail] = side
+            tail += 1
+
+    return match_trade[:matches], match_lot[:matches], match_size[:matches]
+
+
+def summarise_trades(
+    trades: Iterable[Mapping[str, Any]],
+    intervals: Iterable[Mapping[str, Any]],
+    *,
+    now_timestamp_us: int,
+    cutoff_timestamp_us: int,
+    maker_fee_rate: str,
+    taker_fee_rate: str,
+) -> Optional[dict[str, Any]]:
+    """Summarise trades exactly; returns None when a value does not fit the 8dp integer grid."""
+
+    maker_rate = _to_units(maker_fee_rate)
+    taker_rate = _to_units(taker_fee_rate)
+    if maker_rate is None or taker_rate is None:
+        return None
+
+    rows: list[tuple[int, int, int, int, bool]] = []
+    for trade in trades:
+        price = _to_units(trade["price"])
+        size = _to_units(trade["size"])
+        if price is None or size is None:
+            return None
+        timestamp_us = int(trade["timestamp_us"])
+        if price <= 0 or size <= 0 or timestamp_us < cutoff_timestamp_us:
+            continue
+        side = 1 if str(trade["side"]).upper() == "BUY" else -1
+        rows.append((timestamp_us, price, size, side, bool(trade["post_only"])))
+    # Callers normally pass trades in time order; sorted() is stable and cheap when they do.
+    rows.sort(key=lambda row: row[0])
+
+    timestamps = [row[0] for row in rows]
+    prices = [row[1] for row in rows]
+    match_trade, match_lot, match_size = _match_lots(
+        np.array([row[2] for row in rows], dtype=np.int64),
+        np.array([row[3] for row in rows], dtype=np.int8),
+    )
+
+    # Money maths runs on Python ints so nothing is rounded: profit and volume are in
+    # 10**-16 units, fees in 10**-24.
+    realized = [0] * len(rows)
+    for trade_index, lot_index, matched in zip(match_trade.tolist(), match_lot.tolist(), match_size.tolist()):
+        realized[trade_index] += rows[trade_index][3] * (prices[lot_index] - prices[trade_index]) * matched
+    maker_volume = [price * size if post_only else 0 for _, price, size, _, post_only in rows]
+    taker_volume = [0 if post_only else price * size for _, price, size, _, post_only in rows]
+    fees = [
+        price * size * (maker_rate if post_only else taker_rate) for _, price, size, _, post_only in rows
+    ]
+
+    columns = [_suffix_sums(realized), _suffix_sums(maker_volume), _suffix_sums(taker_volume), _suffix_sums(fees)]
+
+    intervals_payload: list[dict[str, Any]] = []
+    total_before = "0"
+    total_after = "0"
+    for spec in intervals:
+        delta_seconds = spec.get("delta_seconds")
+        if delta_seconds is None:
+            start = cutoff_timestamp_us
+        else:
+            start = max(now_timestamp_us - max(int(delta_seconds), 0) * 1_000_000, cutoff_timestamp_us)
+        index = bisect_left(timestamps, start)
+        profit_before, maker, taker, fee_total = (column[index] for column in columns)
+        payload = {
+            "key": spec["key"],
+            "label": spec["label"],
+            "profit_before_fees": _format_units(profit_before, 2 * _SCALE_DIGITS),
+            "maker_volume": _format_units(maker, 2 * _SCALE_DIGITS),
+            "taker_volume": _format_units(taker, 2 * _SCALE_DIGITS),
+            "fee_total": _format_units(fee_total, 3 * _SCALE_DIGITS),
+            "profit_after_fees": _format_units(profit_before * _SCALE - fee_total, 3 * _SCALE_DIGITS),
+        }
+        if spec["key"] == "all":
+            total_before = payload["profit_before_fees"]
+            total_after = payload["profit_after_fees"]
+        intervals_payload.append(payload)
+
+    return {
+        "intervals": intervals_payload,
+        "total_profit_before_fees": total_before,
+        "total_profit_after_fees": total_after,
+    }
+
+
+def _to_units(value: Any) -> Optional[int]:
+    text = str(value)
+    whole, _, fraction = text.partition(".")
+    # Plain positive decimals (the common case) are converted without building a Decimal.
+    if whole.isdigit() and len(fraction) <= _SCALE_DIGITS and (not fraction or fraction.isdigit()):
+        return int(whole + fraction.ljust(_SCALE_DIGITS, "0"))
+    scaled = Decimal(text).scaleb(_SCALE_DIGITS)
+    if scaled != scaled.to_integral_value():
+        return None
+    return int(scaled)
+
+
+def _suffix_sums(values: list[int]) -> list[int]:
+    # Trades are sorted by timestamp, so each interval is a suffix; index len(values) is empty.
+    return list(accumulate(reversed(values), initial=0))[::-1]
+
+
+def _format_units(value: int, digits: int) -> str:
+    text = format(Decimal(value).scaleb(-digits), "f")
+    if "." in text:
+        text = text.rstrip("0").rstrip(".")
+    return "0" if text in ("", "-0") else text
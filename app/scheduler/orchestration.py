@@ -2,12 +2,14 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack, asynccontextmanager
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal, InvalidOperation
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, Coroutine, Optional
 
 from fastapi import FastAPI
+from sqlalchemy.orm import Session
 
 from app.coinbase import (
     CoinbaseClient,
@@ -22,8 +24,8 @@ from app.coinbase.validators import round_size
 from app.config import Settings, get_settings
 from app.db import RunKind, RunStatus, session_scope
 from app.db import crud
-from app.db.models import OrderSide, OrderStatus, RunLog
-from app.llm import LLMClient, LLMResult, Model1Context, Model2Context, Model3Context, prompts
+from app.db.models import OrderSide, OrderStatus
+from app.llm import LLMClientPool, LLMResult, Model1Context, Model2Context, Model3Context
 from app.llm.schemas import Model3Response
 from app.llm.summariser import summarise_to_500_words
 from app.llm.usage import UsageTracker
@@ -34,34 +36,90 @@ logger = logging.getLogger("scheduler.orchestrator")
 MIN_ORDER_NOTIONAL_USDC = Decimal("10")
 MAKER_FEE_BUFFER_RATE = Decimal("0.0035")  # maker-style (post-only) cushion
 TAKER_FEE_BUFFER_RATE = Decimal("0.0075")  # taker-style cushion for stops/market
+MAKER_FEE_FACTOR = Decimal("1") + MAKER_FEE_BUFFER_RATE
+TAKER_FEE_FACTOR = Decimal("1") + TAKER_FEE_BUFFER_RATE
 MARKET_FOLLOW_UP_DELAY_SECONDS = 10
+PLAN_TEXT_CACHE_TTL = timedelta(hours=1)
+PRODUCT_CONSTRAINTS_CACHE_TTL = timedelta(hours=6)
+HISTORY_ENTRY_CACHE_SIZE = 64
 
 
 
 
-def _currencies_for_product(product_id: str) -> set[str]:
-    for separator in ("-", "/"):
-        if separator in product_id:
-            base, quote = product_id.split(separator, 1)
-            return {base.upper(), quote.upper()}
-    return {product_id.upper()}
+_PRODUCT_SEPARATORS = str.maketrans({"-": "\x00", "/": "\x00"})
+
+
+@lru_cache(maxsize=8)
+def _split_product(product_id: str) -> tuple[str, str]:
+    parts = product_id.upper().translate(_PRODUCT_SEPARATORS).split("\x00", 1)
+    if len(parts) == 2:
+        return parts[0], parts[1]
+    return parts[0], parts[0]
+
+
+@lru_cache(maxsize=8)
+def _currencies_for_product(product_id: str) -> frozenset[str]:
+    return frozenset(_split_product(product_id))
 
 
 def filter_portfolio_balances(product_id: str, balances: dict[str, Any]) -> dict[str, Any]:
     allowed = _currencies_for_product(product_id)
-    filtered: dict[str, Any] = {}
-    for currency, snapshot in balances.items():
-        if not currency:
-            continue
-        if currency.upper() in allowed:
-            filtered[currency] = snapshot
-    return filtered
+    return {currency: snapshot for currency, snapshot in balances.items() if currency and currency.upper() in allowed}
+
+
+def _account_balances(account: dict[str, Any]) -> dict[str, Any]:
+    get = account.get
+    return {
+        "available": get("available_balance", {}).get("value"),
+        "hold": get("hold", {}).get("value"),
+        "balance": get("balance", {}).get("value"),
+    }
+
 
 class SchedulerOrchestrator:
     def __init__(self, settings: Optional[Settings] = None) -> None:
         self.settings = settings or get_settings()
+        self._product_base, self._product_quote = _split_product(self.settings.product_id or "")
+        self._allowed_currencies = frozenset((self._product_base, self._product_quote))
         self._planning_lock = asyncio.Lock()
-        self._order_lock = asyncio.Lock()
+        self._cb_client: Optional[CoinbaseClient] = None
+        self._plan_text_cache: Optional[tuple[datetime, str]] = None
+        self._constraints_cache: Optional[tuple[datetime, ProductConstraints]] = None
+        # Formatted prompt-history lines keyed by (kind, row id); the rows never change once written.
+        self._history_entries: dict[tuple[RunKind, int], str] = {}
+        self._pending_tasks: set[asyncio.Task[None]] = set()
+        self._background_writes: set[asyncio.Task[None]] = set()
+        self._llm_pool = LLMClientPool(settings=self.settings, size=2)
+        self._exit_stack = AsyncExitStack()
+
+    async def startup(self) -> None:
+        """Open the long-lived clients once; ``shutdown`` closes them."""
+
+        self._exit_stack.push_async_callback(self._llm_pool.close)
+        if self.settings.coinbase_api_key and self.settings.coinbase_api_secret:
+            self._cb_client = await self._exit_stack.enter_async_context(CoinbaseClient(settings=self.settings))
+        else:
+            # The dashboard and stub mode work without Coinbase; only the runs that need it fail.
+            logger.warning("Coinbase credentials are not configured; scheduled runs will fail until they are set")
+
+    async def shutdown(self) -> None:
+        for task in list(self._pending_tasks):
+            task.cancel()
+        await self._drain_background_writes()
+        await self._exit_stack.aclose()
+        self._cb_client = None
+
+    @property
+    def coinbase(self) -> CoinbaseClient:
+        """Shared Coinbase client, open between ``startup`` and ``shutdown``."""
+
+        if self._cb_client is None:
+            # A client built here would have nothing left to close it after shutdown.
+            raise RuntimeError(
+                "Coinbase client is not open: credentials are not configured, or the orchestrator"
+                " is not started or already shut down"
+            )
+        return self._cb_client
 
     @asynccontextmanager
     async def _planning_guard(self, kind: RunKind, triggered_by: str):
@@ -80,16 +138,18 @@ class SchedulerOrchestrator:
     async def run_plan(self, *, triggered_by: str = "schedule") -> None:
         async with self._planning_guard(RunKind.PLAN, triggered_by):
             usage = UsageTracker()
-            run_id = self._start_run(RunKind.PLAN, triggered_by)
+            run_id = await self._start_run(RunKind.PLAN, triggered_by)
             try:
-                history, executed_summary = self._load_plan_context()
-                async with CoinbaseClient(settings=self.settings) as cb_client:
-                    market_service = MarketService(cb_client)
-                    snapshot = await market_service.current_snapshot(self.settings.product_id)
-                    market_overview = self._format_market_snapshot(snapshot)
-                    self._record_price_snapshot(snapshot)
-
-                async with LLMClient(settings=self.settings, usage_tracker=usage) as llm:
+                now = datetime.now(timezone.utc)
+                market_service = MarketService(self.coinbase)
+                (history, executed_summary), snapshot = await asyncio.gather(
+                    self._load_plan_context(),
+                    market_service.current_snapshot(self.settings.product_id),
+                )
+                market_overview = self._format_market_snapshot(snapshot)
+                self._record_price_snapshot_in_background(snapshot, ts=now)
+
+                async with self._llm_pool.acquire(usage_tracker=usage) as llm:
                     context = Model1Context(
                         market_overview=market_overview,
                         recent_daily_history=history,
@@ -97,82 +157,85 @@ class SchedulerOrchestrator:
                     )
                     llm_result = await llm.run_model1(context)
                     summary_text = await summarise_to_500_words(llm, llm_result.text)
-                self._persist_plan(context, llm_result, summary_text)
-                self._finish_run(run_id, RunStatus.SUCCESS, usage, extra={"triggered_by": triggered_by})
+                await self._persist_plan(llm_result, summary_text, now=now)
+                await self._finish_run(run_id, RunStatus.SUCCESS, usage, extra={"triggered_by": triggered_by})
             except Exception as exc:  # pragma: no cover - defensive
                 logger.exception("Plan job failed")
-                self._finish_run(run_id, RunStatus.FAILED, usage, error=str(exc), extra={"triggered_by": triggered_by})
+                await self._finish_run(run_id, RunStatus.FAILED, usage, error=str(exc), extra={"triggered_by": triggered_by})
                 raise
 
     async def run_order(self, *, triggered_by: str = "schedule") -> None:
         async with self._planning_guard(RunKind.ORDER, triggered_by):
-            if not self._order_lock.locked():
-                logger.info("Starting order job", extra={"triggered_by": triggered_by})
-            async with self._order_lock:
-                usage = UsageTracker()
-                run_id = self._start_run(RunKind.ORDER, triggered_by)
-                try:
-                    await self._execute_order(run_id, usage, triggered_by)
-                except Exception as exc:  # pragma: no cover - defensive
-                    logger.exception("Order job failed")
-                    self._finish_run(run_id, RunStatus.FAILED, usage, error=str(exc), extra={"triggered_by": triggered_by})
-                    raise
+            logger.info("Starting order job", extra={"triggered_by": triggered_by})
+            usage = UsageTracker()
+            run_id = await self._start_run(RunKind.ORDER, triggered_by)
+            try:
+                await self._execute_order(run_id, usage, triggered_by)
+            except Exception as exc:  # pragma: no cover - defensive
+                logger.exception("Order job failed")
+                await self._finish_run(run_id, RunStatus.FAILED, usage, error=str(exc), extra={"triggered_by": triggered_by})
+                raise
     
     async def run_pnl(self) -> None:
         usage = UsageTracker()
-        run_id = self._start_run(RunKind.PNL, "pnl-refresh")
+        run_id = await self._start_run(RunKind.PNL, "pnl-refresh")
         try:
-            async with CoinbaseClient(settings=self.settings) as client:
-                summary = await pnl.calculate_pnl_summary(client, product_id=self.settings.product_id)
-            summary_json = pnl.summary_to_json(summary)
-            with session_scope(self.settings) as session:
-                crud.record_pnl_snapshot(
-                    session,
-                    product_id=self.settings.product_id,
-                    summary_json=summary_json,
-                )
-            self._finish_run(
+            now = datetime.now(timezone.utc)
+            summary = await pnl.calculate_pnl_summary(self.coinbase, product_id=self.settings.product_id, now=now)
+            await self._record_pnl_snapshot(pnl.summary_to_json(summary), ts=now)
+            await self._finish_run(
                 run_id,
                 RunStatus.SUCCESS,
                 usage,
-                extra={"snapshot_ts": datetime.now(timezone.utc).isoformat()},
+                extra={"snapshot_ts": now.isoformat()},
             )
         except Exception as exc:  # pragma: no cover - defensive
             logger.exception("PnL refresh failed")
-            self._finish_run(run_id, RunStatus.FAILED, usage, error=str(exc))
+            await self._finish_run(run_id, RunStatus.FAILED, usage, error=str(exc))
             raise
     
     async def _execute_order(self, run_id: int, usage: UsageTracker, triggered_by: str) -> None:
-        history, executed_summary = self._load_order_context()
-        plan_text = self._latest_plan_text()
+        cb_client = self.coinbase
+        (history, executed_summary), plan_text, constraints = await asyncio.gather(
+            self._load_order_context(),
+            self._latest_plan_text(),
+            self._product_constraints(cb_client),
+        )
         if plan_text is None:
             raise RuntimeError("Plan not found; model 2 cannot run")
 
-        async with CoinbaseClient(settings=self.settings) as cb_client:
-            market_service = MarketService(cb_client)
-            product = await cb_client.get_product(self.settings.product_id)
-            constraints = ProductConstraints.from_product(product, self.settings.min_distance_pct)
-            execution = ExecutionService(cb_client, product_id=self.settings.product_id, constraints=constraints)
+        market_service = MarketService(cb_client)
+        execution = ExecutionService(cb_client, product_id=self.settings.product_id, constraints=constraints)
 
-            async with LLMClient(settings=self.settings, usage_tracker=usage) as llm:
+        started_at = datetime.now(timezone.utc)
+        market_snapshot, portfolio_balances = await asyncio.gather(
+            market_service.current_snapshot(self.settings.product_id),
+            self._capture_portfolio_snapshot(cb_client),
+        )
+        self._record_price_snapshot_in_background(market_snapshot, ts=started_at)
+        self._record_portfolio_snapshot_in_background(
+            crud.PortfolioSnapshotRecord(ts=started_at, balances_json=portfolio_balances)
+        )
+
+        async with self._llm_pool.acquire(usage_tracker=usage) as llm:
+            model2_context = Model2Context(
+                daily_plan=plan_text,
+                recent_two_hour_history=history,
+                executed_orders_summary=executed_summary,
+                portfolio_snapshot=self._format_portfolio_snapshot(portfolio_balances),
+                market_snapshot=self._format_market_snapshot(market_snapshot),
+                constraint_notes=self._format_constraints(constraints, market_snapshot.mid),
+            )
+            model2_result = await llm.run_model2(model2_context)
+            # The summary only feeds prompt history; overlap it with Model 3 and the drift check.
+            summary_task = asyncio.create_task(summarise_to_500_words(llm, model2_result.text))
+            try:
+                # Retries only re-run Model 3: a drift refreshes the mid it validates against, and a
+                # rejection feeds the error back. Model 2's analysis is reused as-is.
                 additional_validation_notes = ""
+                prompt_saved = False
                 for attempt in (1, 2):
-                    market_snapshot = await market_service.current_snapshot(self.settings.product_id)
-                    self._record_price_snapshot(market_snapshot)
-
-                    portfolio_balances = await self._capture_portfolio_snapshot(cb_client)
-                    market_snapshot_text = self._format_market_snapshot(market_snapshot)
-                    constraints_text = self._format_constraints(constraints, market_snapshot.mid)
-                    model2_context = Model2Context(
-                        daily_plan=plan_text,
-                        recent_two_hour_history=history,
-                        executed_orders_summary=executed_summary,
-                        portfolio_snapshot=self._format_portfolio_snapshot(portfolio_balances),
-                        market_snapshot=market_snapshot_text,
-                        constraint_notes=constraints_text,
-                    )
-                    model2_result = await llm.run_model2(model2_context)
-
+                    attempt_started_at = datetime.now(timezone.utc)
                     validation_notes = self._build_validation_notes(constraints, market_snapshot.mid)
                     if additional_validation_notes:
                         validation_notes = f"{validation_notes} {additional_validation_notes}".strip()
@@ -187,74 +250,104 @@ class SchedulerOrchestrator:
                     has_market_order = any(order.order_type is OrderType.MARKET for order in planned_orders)
 
                     if planned_orders:
-                        drift_ok = await self._check_price_drift(market_service, market_snapshot.mid)
+                        latest_snapshot = await market_service.current_snapshot(self.settings.product_id)
+                        self._record_price_snapshot_in_background(latest_snapshot)
+                        drift_ok = self._check_price_drift(market_snapshot.mid, latest_snapshot.mid)
                         if not drift_ok and attempt == 1:
-                            logger.info("Price drift exceeded threshold; re-running Model 2/3")
-                            history.insert(0, f"Previous run drifted at {datetime.now(timezone.utc).isoformat()}")
+                            logger.info("Price drift exceeded threshold; re-running Model 3")
+                            additional_validation_notes = (
+                                f"Mid moved from {market_snapshot.mid} to {latest_snapshot.mid} "
+                                "since the analysis was written."
+                            )
+                            market_snapshot = latest_snapshot
                             continue
 
-                    await self._persist_order_plan(
-                        model2_context,
+                    # Save the plan before anything reaches the exchange, so live orders always have
+                    # one. The prompt history row is written once, with the first attempt's plan.
+                    summary_text: Optional[str] = None
+                    if not prompt_saved:
+                        try:
+                            summary_text = await summary_task
+                        except Exception:
+                            logger.exception("Summarising the order analysis failed; saving the plan without prompt history")
+                    await self._save_order_plan(
                         model2_result,
                         model3_response,
-                        planned_orders,
-                        llm,
+                        summary_text,
                         market_snapshot.mid,
+                        now=attempt_started_at,
                     )
+                    prompt_saved = True
 
                     placed_order_responses = []
+                    rejection: Optional[ValueError] = None
                     if planned_orders and self.settings.execution_enabled:
                         try:
                             placed_order_responses = await execution.place_orders(planned_orders, mid_price=market_snapshot.mid)
                         except ValueError as exc:
                             logger.warning("Order validation failed: %s", exc)
-                            if attempt == 1:
-                                timestamp = datetime.now(timezone.utc).isoformat()
-                                history.insert(0, f"{timestamp}Z :: Last attempt rejected: {exc}")
-                                additional_validation_notes = f"Previous attempt rejected: {exc}."
-                                continue
-                            raise
-                    with session_scope(self.settings) as session:
-                        sync_result = await execution.sync_open_and_fills(session)
-                    self._finish_run(
-                        run_id,
-                        RunStatus.SUCCESS,
+                            rejection = exc
+
+                    if rejection is not None:
+                        if attempt == 1:
+                            additional_validation_notes = f"Previous attempt rejected: {rejection}."
+                            continue
+                        raise rejection
+
+                    # The exchange is read first, with no session open; the sync rows and the run
+                    # finish then go out together in one short transaction off the loop.
+                    open_records, executed_records = await execution.fetch_open_and_fills()
+                    await self._drain_background_writes()
+                    finish_payload = self._usage_payload(
                         usage,
-                        extra={
+                        {
                             "triggered_by": triggered_by,
                             "planned_orders": [self._planned_order_to_dict(order) for order in planned_orders],
                             "placed_orders": placed_order_responses,
                         },
                     )
+
+                    def _write() -> None:
+                        with session_scope(self.settings) as session:
+                            execution.store_open_and_fills(session, open_records, executed_records)
+                            self._log_run_finish(session, run_id, RunStatus.SUCCESS, finish_payload)
+
+                    await asyncio.to_thread(_write)
                     if has_market_order:
                         self._schedule_market_followup(triggered_by="market_followup")
                     return
 
-            raise RuntimeError("Model 2/3 failed to produce a plan after drift checks")
+                raise RuntimeError("Model 3 failed to produce a plan after drift checks")
+            finally:
+                summary_task.cancel()
 
     async def run_monitor(self) -> None:
+        if self._planning_lock.locked():
+            # The monitor runs every minute; skip this tick rather than queue behind a plan/order run.
+            logger.info("Skipping monitor run while a plan or order run is active")
+            return
+
         new_fills: list[str] = []
         open_orders: list[crud.OpenOrderRecord] = []
         async with self._planning_guard(RunKind.MONITOR, "schedule"):
             usage = UsageTracker()
-            run_id = self._start_run(RunKind.MONITOR, "schedule")
+            run_id = await self._start_run(RunKind.MONITOR, "schedule")
             try:
-                async with CoinbaseClient(settings=self.settings) as cb_client:
-                    execution = ExecutionService(
-                        cb_client,
-                        product_id=self.settings.product_id,
-                        constraints=None,
-                    )
-                    with session_scope(self.settings) as session:
-                        sync_result = await execution.sync_open_and_fills(session)
-                    open_orders = sync_result.open_orders
-                    new_fills = [
-                        record.order_id
-                        for record in sync_result.executed_orders
-                        if record.order_id in sync_result.changed_order_ids
-                        and record.status == OrderStatus.FILLED
-                    ]
-                self._finish_run(
+                execution = ExecutionService(
+                    self.coinbase,
+                    product_id=self.settings.product_id,
+                    constraints=None,
+                )
+                with session_scope(self.settings) as session:
+                    sync_result = await execution.sync_open_and_fills(session)
+                open_orders = sync_result.open_orders
+                new_fills = [
+                    record.order_id
+                    for record in sync_result.executed_orders
+                    if record.order_id in sync_result.changed_order_ids
+                    and record.status == OrderStatus.FILLED
+                ]
+                await self._finish_run(
                     run_id,
                     RunStatus.SUCCESS,
                     usage,
@@ -262,19 +355,22 @@ class SchedulerOrchestrator:
                 )
             except Exception as exc:  # pragma: no cover - defensive
                 logger.exception("Monitor job failed")
-                self._finish_run(run_id, RunStatus.FAILED, usage, error=str(exc))
+                await self._finish_run(run_id, RunStatus.FAILED, usage, error=str(exc))
                 raise
 
-        if not open_orders and not self._order_lock.locked():
+        if not open_orders and not self._planning_lock.locked():
             await self.run_order(triggered_by="no_open_orders")
 
-    def _start_run(self, kind: RunKind, triggered_by: str) -> int:
-        with session_scope(self.settings) as session:
-            payload = {"triggered_by": triggered_by} if triggered_by != "schedule" else None
-            run_log = crud.log_run_start(session, kind, usage_json=payload)
-            return run_log.id
+    async def _start_run(self, kind: RunKind, triggered_by: str) -> int:
+        payload = {"triggered_by": triggered_by} if triggered_by != "schedule" else None
 
-    def _finish_run(
+        def _write() -> int:
+            with session_scope(self.settings) as session:
+                return crud.log_run_start_fast(session, kind, usage_json=payload)
+
+        return await asyncio.to_thread(_write)
+
+    async def _finish_run(
         self,
         run_id: Optional[int],
         status: RunStatus,
@@ -285,27 +381,76 @@ class SchedulerOrchestrator:
     ) -> None:
         if not run_id:
             return
-        with session_scope(self.settings) as session:
-            run: RunLog | None = session.get(RunLog, run_id)
-            if not run:
-                return
-            usage_payload = {
-                "records": usage.to_json(),
-                "totals": usage.totals(),
-            }
-            if extra:
-                usage_payload.update(extra)
-            crud.log_run_finish(
-                session,
-                run,
-                status=status,
-                error_text=error,
-                usage_json=usage_payload,
-            )
+        await self._drain_background_writes()
+        usage_payload = self._usage_payload(usage, extra)
+
+        def _write() -> None:
+            with session_scope(self.settings) as session:
+                self._log_run_finish(session, run_id, status, usage_payload, error=error)
+
+        await asyncio.to_thread(_write)
+
+    def _usage_payload(self, usage: UsageTracker, extra: Optional[dict[str, Any]] = None) -> dict[str, Any]:
+        usage_payload = {
+            "records": usage.to_json(),
+            "totals": usage.totals(),
+        }
+        if extra:
+            usage_payload.update(extra)
+        return usage_payload
+
+    def _log_run_finish(
+        self,
+        session: Session,
+        run_id: Optional[int],
+        status: RunStatus,
+        usage_payload: dict[str, Any],
+        *,
+        error: Optional[str] = None,
+    ) -> None:
+        if not run_id:
+            return
+        crud.log_run_finish_by_id(
+            session,
+            run_id,
+            status=status,
+            error_text=error,
+            usage_json=usage_payload,
+        )
+
+    async def _load_plan_context(self) -> tuple[list[str], list[str]]:
+        history, executed_summary = await asyncio.gather(
+            asyncio.to_thread(self._load_prompt_history, RunKind.PLAN, 7),
+            asyncio.to_thread(self._load_plan_executed_orders),
+        )
+        return history, executed_summary
+
+    async def _load_order_context(self) -> tuple[list[str], list[str]]:
+        history, executed_summary = await asyncio.gather(
+            asyncio.to_thread(self._load_prompt_history, RunKind.ORDER, 12),
+            asyncio.to_thread(self._load_order_executed_orders),
+        )
+        return history, executed_summary
 
-    def _load_plan_context(self) -> tuple[list[str], list[str]]:
+    def _load_prompt_history(self, kind: RunKind, limit: int) -> list[str]:
+        with session_scope(self.settings) as session:
+            history_models = crud.get_recent_prompt_history(session, kind, limit=limit)
+            return [self._history_entry(kind, item) for item in history_models]
+
+    def _history_entry(self, kind: RunKind, item) -> str:
+        key = (kind, item.id)
+        entries = self._history_entries
+        entry = entries.pop(key, None)
+        if entry is None:
+            entry = self._format_prompt_history_entry(item.ts, item.compact_summary_500w or item.response_text)
+            if len(entries) >= HISTORY_ENTRY_CACHE_SIZE:
+                entries.pop(next(iter(entries)), None)
+        # Re-inserting keeps the dict in least-recently-used order.
+        entries[key] = entry
+        return entry
+
+    def _load_plan_executed_orders(self) -> list[str]:
         with session_scope(self.settings) as session:
-            history_models = crud.get_recent_prompt_history(session, RunKind.PLAN, limit=7)
             executed_orders = crud.executed_orders_since(
                 session,
                 datetime.now(timezone.utc) - timedelta(days=7),
@@ -316,14 +461,10 @@ class SchedulerOrchestrator:
                 for order in executed_orders
                 if order.status not in {OrderStatus.OPEN, OrderStatus.NEW}
             ]
-            executed_orders = executed_orders[:20]
-        history = [self._format_prompt_history_entry(item.ts, item.compact_summary_500w or item.response_text) for item in history_models]
-        executed_summary = [self._format_executed_order(order) for order in executed_orders]
-        return history, executed_summary
+            return [self._format_executed_order(order) for order in executed_orders[:20]]
 
-    def _load_order_context(self) -> tuple[list[str], list[str]]:
+    def _load_order_executed_orders(self) -> list[str]:
         with session_scope(self.settings) as session:
-            history_models = crud.get_recent_prompt_history(session, RunKind.ORDER, limit=12)
             executed_orders = crud.recent_executed_orders(
                 session,
                 hours=24,
@@ -334,122 +475,197 @@ class SchedulerOrchestrator:
                 for order in executed_orders
                 if order.status in {OrderStatus.FILLED, OrderStatus.EXPIRED}
             ]
-            executed_orders = executed_orders[:20]
-        history = [self._format_prompt_history_entry(item.ts, item.compact_summary_500w or item.response_text) for item in history_models]
-        executed_summary = [self._format_executed_order(order) for order in executed_orders]
-        return history, executed_summary
+            return [self._format_executed_order(order) for order in executed_orders[:20]]
 
-    def _persist_plan(self, context: Model1Context, llm_result: LLMResult, summary_text: str) -> None:
-        now = datetime.now(timezone.utc)
-        sources = self._extract_sources(llm_result.response)
-        with session_scope(self.settings) as session:
-            crud.save_daily_plan(session, crud.PlanRecord(ts=now, raw_text=llm_result.text, machine_json=None))
-            crud.save_prompt_history(
-                session,
-                RunKind.PLAN,
-                crud.PromptRecord(
-                    ts=now,
-                    prompt_text=prompts.build_model1_user_prompt(context),
-                    response_text=llm_result.text,
-                    compact_summary_500w=summary_text,
-                    sources_json=sources,
-                ),
-            )
+    async def _persist_plan(self, llm_result: LLMResult, summary_text: str, *, now: datetime) -> None:
+        sources = llm_result.sources
+
+        def _write() -> None:
+            with session_scope(self.settings) as session:
+                crud.save_daily_plan(session, crud.PlanRecord(ts=now, raw_text=llm_result.text, machine_json=None))
+                crud.save_prompt_history(
+                    session,
+                    RunKind.PLAN,
+                    crud.PromptRecord(
+                        ts=now,
+                        prompt_text=llm_result.prompt_text,
+                        response_text=llm_result.text,
+                        compact_summary_500w=summary_text,
+                        sources_json=sources,
+                    ),
+                )
 
-    async def _persist_order_plan(
+        await asyncio.to_thread(_write)
+        self._plan_text_cache = (now, llm_result.text)
+
+    async def _save_order_plan(
         self,
-        context: Model2Context,
         model2_result: LLMResult,
         model3_response: Model3Response,
-        planned_orders: list[PlannedOrder],
-        llm: LLMClient,
-        mid_price: Any,
+        summary_text: Optional[str],
+        mid_price: Decimal,
+        *,
+        now: datetime,
     ) -> None:
-        now = datetime.now(timezone.utc)
-        machine_json = model3_response.model_dump(mode="json")
-        summary_text = await summarise_to_500_words(llm, model2_result.text)
-        mid_value = mid_price if isinstance(mid_price, Decimal) else Decimal(str(mid_price or "0"))
-        with session_scope(self.settings) as session:
-            crud.save_two_hour_plan(
-                session,
-                crud.TwoHourPlanRecord(
-                    ts=now,
-                    t0_mid=mid_value,
-                    raw_text=model2_result.text,
-                    machine_json=machine_json,
-                ),
-            )
-            crud.save_prompt_history(
-                session,
-                RunKind.ORDER,
-                crud.PromptRecord(
-                    ts=now,
-                    prompt_text=prompts.build_model2_user_prompt(context),
-                    response_text=model2_result.text,
-                    compact_summary_500w=summary_text,
-                    sources_json=self._extract_sources(model2_result.response),
-                ),
-            )
+        def _write() -> None:
+            with session_scope(self.settings) as session:
+                self._persist_order_plan(session, model2_result, model3_response, summary_text, mid_price, now=now)
+
+        await asyncio.to_thread(_write)
+
+    def _persist_order_plan(
+        self,
+        session: Session,
+        model2_result: LLMResult,
+        model3_response: Model3Response,
+        summary_text: Optional[str],
+        mid_price: Decimal,
+        *,
+        now: datetime,
+    ) -> None:
+        """Record the Model 3 plan; the Model 2 prompt row is skipped when ``summary_text`` is None."""
+
+        crud.save_two_hour_plan(
+            session,
+            crud.TwoHourPlanRecord(
+                ts=now,
+                t0_mid=mid_price,
+                raw_text=model2_result.text,
+                machine_json=model3_response.model_dump(mode="json"),
+            ),
+        )
+        if summary_text is None:
+            return
+        crud.save_prompt_history(
+            session,
+            RunKind.ORDER,
+            crud.PromptRecord(
+                ts=now,
+                prompt_text=model2_result.prompt_text,
+                response_text=model2_result.text,
+                compact_summary_500w=summary_text,
+                sources_json=model2_result.sources,
+            ),
+        )
 
     async def _capture_portfolio_snapshot(self, client: CoinbaseClient) -> dict[str, Any]:
         response = await client.list_accounts(limit=250)
-        balances: dict[str, Any] = {}
-        for account in response.get("accounts", []):
-            currency = account.get("currency")
-            balances[currency] = {
-                "available": account.get("available_balance", {}).get("value"),
-                "hold": account.get("hold", {}).get("value"),
-                "balance": account.get("balance", {}).get("value"),
-            }
-        filtered_balances = filter_portfolio_balances(self.settings.product_id, balances)
-        with session_scope(self.settings) as session:
-            crud.record_portfolio_snapshot(
-                session,
-                crud.PortfolioSnapshotRecord(ts=datetime.now(timezone.utc), balances_json=filtered_balances),
-            )
-        return filtered_balances
+        allowed = self._allowed_currencies
+        return {
+            currency: _account_balances(account)
+            for account in response.get("accounts", ())
+            if (currency := account.get("currency")) and currency.upper() in allowed
+        }
 
-    async def _check_price_drift(self, market_service: MarketService, start_mid: Any) -> bool:
-        current = await market_service.current_snapshot(self.settings.product_id)
-        self._record_price_snapshot(current)
-        drift = abs(current.mid - start_mid) / start_mid
-        return drift < self.settings.price_drift_pct
+    def _check_price_drift(self, start_mid: Decimal, current_mid: Decimal) -> bool:
+        # |current - start| / start < threshold, cross-multiplied to avoid a Decimal division.
+        diff = current_mid - start_mid if current_mid >= start_mid else start_mid - current_mid
+        return diff < self.settings.price_drift_pct * start_mid
 
     def _schedule_market_followup(self, *, triggered_by: str) -> None:
-        async def _delayed_order() -> None:
-            await asyncio.sleep(MARKET_FOLLOW_UP_DELAY_SECONDS)
-            try:
-                await self.run_order(triggered_by=triggered_by)
-            except Exception:  # pragma: no cover - defensive
-                logger.exception("Follow-up order run after market order failed")
-
         logger.info(
             "Scheduling follow-up order run after market order",
             extra={"triggered_by": triggered_by, "delay_seconds": MARKET_FOLLOW_UP_DELAY_SECONDS},
         )
-        asyncio.create_task(_delayed_order())
+        # The event loop only keeps weak references to tasks; hold one until it finishes.
+        task = asyncio.create_task(_delayed_order(self, triggered_by, MARKET_FOLLOW_UP_DELAY_SECONDS))
+        self._pending_tasks.add(task)
+        task.add_done_callback(self._pending_tasks.discard)
+
+    def _record_price_snapshot_in_background(self, snapshot, *, ts: Optional[datetime] = None) -> None:
+        # Nothing later in the run reads these rows, so keep the commit off the critical path.
+        self._track_background_write(self._record_price_snapshot(snapshot, ts=ts))
+
+    def _record_portfolio_snapshot_in_background(self, record: crud.PortfolioSnapshotRecord) -> None:
+        # Written as soon as it is captured, so a run that fails later still keeps it.
+        self._track_background_write(self._record_portfolio_snapshot(record))
+
+    def _track_background_write(self, write: Coroutine[Any, Any, None]) -> None:
+        task = asyncio.create_task(write)
+        self._background_writes.add(task)
+        task.add_done_callback(self._background_writes.discard)
+
+    async def _drain_background_writes(self) -> None:
+        """Wait for outstanding snapshot writes so a finished run has all of its rows."""
+
+        results = await asyncio.gather(*self._background_writes, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.error("Background snapshot write failed", exc_info=result)
+
+    async def _record_price_snapshot(self, snapshot, *, ts: Optional[datetime] = None) -> None:
+        def _write() -> None:
+            with session_scope(self.settings) as session:
+                crud.record_price_snapshot_fast(
+                    session,
+                    crud.PriceSnapshotRecord(
+                        ts=ts or datetime.now(timezone.utc),
+                        product_id=self.settings.product_id,
+                        best_bid=snapshot.best_bid,
+                        best_ask=snapshot.best_ask,
+                        mid=snapshot.mid,
+                    ),
+                )
 
-    def _record_price_snapshot(self, snapshot) -> None:
-        with session_scope(self.settings) as session:
-            crud.record_price_snapshot(
-                session,
-                crud.PriceSnapshotRecord(
-                    ts=datetime.now(timezone.utc),
+        await asyncio.to_thread(_write)
+
+    async def _record_portfolio_snapshot(self, record: crud.PortfolioSnapshotRecord) -> None:
+        def _write() -> None:
+            with session_scope(self.settings) as session:
+                crud.record_portfolio_snapshot_fast(session, record)
+
+        await asyncio.to_thread(_write)
+
+    async def _record_pnl_snapshot(self, summary_json: dict[str, Any], *, ts: datetime) -> None:
+        def _write() -> None:
+            with session_scope(self.settings) as session:
+                crud.record_pnl_snapshot(
+                    session,
                     product_id=self.settings.product_id,
-                    best_bid=snapshot.best_bid,
-                    best_ask=snapshot.best_ask,
-                    mid=snapshot.mid,
-                ),
-            )
+                    summary_json=summary_json,
+                    ts=ts,
+                )
 
-    def _latest_plan_text(self) -> Optional[str]:
-        with session_scope(self.settings) as session:
-            plan = crud.latest_daily_plan(session)
-            return plan.raw_text if plan else None
+        await asyncio.to_thread(_write)
+
+    async def _product_constraints(self, client: CoinbaseClient) -> ProductConstraints:
+        # Tick and size increments rarely change; refresh them a few times a day.
+        now = datetime.now(timezone.utc)
+        if self._constraints_cache is not None:
+            cached_at, constraints = self._constraints_cache
+            if now - cached_at < PRODUCT_CONSTRAINTS_CACHE_TTL:
+                return constraints
+        product = await client.get_product(self.settings.product_id)
+        constraints = ProductConstraints.from_product(product, self.settings.min_distance_pct)
+        self._constraints_cache = (now, constraints)
+        return constraints
+
+    async def _latest_plan_text(self) -> Optional[str]:
+        now = datetime.now(timezone.utc)
+        if self._plan_text_cache is not None:
+            cached_at, cached_text = self._plan_text_cache
+            if now - cached_at < PLAN_TEXT_CACHE_TTL:
+                return cached_text
+
+        def _read() -> Optional[str]:
+            with session_scope(self.settings) as session:
+                return crud.latest_daily_plan_text(session)
+
+        plan_text = await asyncio.to_thread(_read)
+        if plan_text is not None:
+            self._plan_text_cache = (now, plan_text)
+        return plan_text
 
     def _format_prompt_history_entry(self, ts: datetime, text: str) -> str:
-        snippet = text.strip().splitlines()
-        truncated = " ".join(snippet)[:500]
+        # Only join as many lines as the 500-char snippet can use.
+        parts: list[str] = []
+        joined_length = -1
+        for line in text.strip().splitlines():
+            parts.append(line)
+            joined_length += len(line) + 1
+            if joined_length >= 500:
+                break
+        truncated = " ".join(parts)[:500]
         return f"{ts.isoformat()}Z :: {truncated}"
 
     def _format_executed_order(self, order) -> str:
@@ -491,14 +707,14 @@ class SchedulerOrchestrator:
                 continue
 
             cost = order.limit_price * order.base_size
-            fee_rate = self._fee_buffer_rate(order)
-            total_cost = cost * (Decimal("1") + fee_rate)
+            factor = self._fee_factor(order)
+            total_cost = cost * factor
             if total_cost <= remaining_cap:
                 adjusted_orders.append(order)
                 remaining_cap = max(remaining_cap - total_cost, Decimal("0"))
                 continue
 
-            denominator = order.limit_price * (Decimal("1") + fee_rate)
+            denominator = order.limit_price * factor
             max_base = remaining_cap / denominator if denominator else Decimal("0")
             max_base = round_size(max_base, constraints)
             if max_base <= Decimal("0") or max_base < constraints.min_size:
@@ -507,7 +723,7 @@ class SchedulerOrchestrator:
                     extra={
                         "available_usdc": str(available_quote),
                         "limit_price": str(order.limit_price),
-                        "fee_buffer_rate": str(fee_rate),
+                        "fee_buffer_rate": str(self._fee_buffer_rate(order)),
                     },
                 )
                 continue
@@ -524,11 +740,16 @@ class SchedulerOrchestrator:
                 )
             )
             adjusted_cost = order.limit_price * max_base
-            adjusted_total = adjusted_cost * (Decimal("1") + fee_rate)
+            adjusted_total = adjusted_cost * factor
             remaining_cap = max(remaining_cap - adjusted_total, Decimal("0"))
 
         return adjusted_orders
 
+    def _fee_factor(self, order: PlannedOrder) -> Decimal:
+        if order.order_type is OrderType.LIMIT and order.post_only:
+            return MAKER_FEE_FACTOR
+        return TAKER_FEE_FACTOR
+
     def _fee_buffer_rate(self, order: PlannedOrder) -> Decimal:
         if order.order_type is OrderType.LIMIT and order.post_only:
             return MAKER_FEE_BUFFER_RATE
@@ -552,20 +773,16 @@ class SchedulerOrchestrator:
             return None
 
     def _quote_currency(self) -> str:
-        product_id = self.settings.product_id or ""
-        for separator in ("-", "/"):
-            if separator in product_id:
-                _, quote = product_id.split(separator, 1)
-                return quote.upper()
-        return product_id.upper()
+        return self._product_quote
 
     def _format_portfolio_snapshot(self, balances: dict[str, Any]) -> str:
-        lines = []
-        for currency, entry in balances.items():
-            lines.append(
-                f"{currency}: available={entry.get('available')} hold={entry.get('hold')} total={entry.get('balance')}"
-            )
-        return "\n".join(lines) if lines else "(no balances for target product)"
+        if not balances:
+            return "(no balances for target product)"
+        # Entries come from _account_balances, so all three keys are always present.
+        return "\n".join(
+            f"{currency}: available={entry['available']} hold={entry['hold']} total={entry['balance']}"
+            for currency, entry in balances.items()
+        )
 
     def _format_constraints(self, constraints: ProductConstraints, mid_price) -> str:
         threshold = mid_price * constraints.min_distance_pct if mid_price else None
@@ -612,16 +829,6 @@ class SchedulerOrchestrator:
             data["stop_price"] = str(order.stop_price)
         return data
 
-    def _extract_sources(self, response: dict[str, Any]) -> Optional[list[Any]]:
-        if not response:
-            return None
-        output = response.get("output") or response.get("outputs")
-        if not output:
-            return None
-        if isinstance(output, list):
-            return output
-        return [output]
-
     def _build_validation_notes(self, constraints: ProductConstraints, mid_price) -> str:
         return (
             f"Constraints: min distance {constraints.min_distance_pct}, price increment"
@@ -634,6 +841,14 @@ class SchedulerOrchestrator:
         return snapshot.mid if snapshot else None
 
 
+async def _delayed_order(orchestrator: SchedulerOrchestrator, triggered_by: str, delay: float) -> None:
+    await asyncio.sleep(delay)
+    try:
+        await orchestrator.run_order(triggered_by=triggered_by)
+    except Exception:  # pragma: no cover - defensive
+        logger.exception("Follow-up order run after market order failed")
+
+
 def get_orchestrator(app: FastAPI) -> SchedulerOrchestrator:
     orchestrator = getattr(app.state, "orchestrator", None)
     if orchestrator is None:
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.db import models
+
+
+@pytest.fixture(scope="session")
+def engine() -> Iterator[Engine]:
+    """One in-memory database for the whole run; the schema is created once."""
+
+    engine = create_engine(
+        "sqlite:///:memory:",
+        future=True,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    # pysqlite manages BEGIN itself and breaks SAVEPOINTs; let SQLAlchemy emit it instead.
+    @event.listens_for(engine, "connect")
+    def _configure_sqlite(dbapi_connection, connection_record) -> None:
+        dbapi_connection.isolation_level = None
+        # Nothing here needs durability: skip fsyncs, keep journal/temp data in RAM and
+        # take the lock once for the single pooled connection.
+        cursor = dbapi_connection.cursor()
+        for pragma in (
+            "PRAGMA synchronous=OFF",
+            "PRAGMA journal_mode=MEMORY",
+            "PRAGMA temp_store=MEMORY",
+            "PRAGMA locking_mode=EXCLUSIVE",
+        ):
+            cursor.execute(pragma)
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(connection) -> None:
+        connection.exec_driver_sql("BEGIN")
+
+    models.Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db_session(engine: Engine) -> Iterator[Session]:
+    """A session joined to an outer transaction that is rolled back after the test.
+
+    ``session.commit()`` inside a test only releases a SAVEPOINT, so tests stay isolated.
+    """
+
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
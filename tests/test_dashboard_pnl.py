@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import random
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 
+import pytest
+
 from app.dashboard import pnl
 from app.db.models import OrderSide
 
@@ -92,3 +95,84 @@ def test_extract_fill_identifier_hashes_when_missing_id() -> None:
     fingerprint = pnl._extract_fill_identifier(fill)
     assert fingerprint is not None
     assert len(fingerprint) == 40
+
+
+def test_numba_fallback_matches_python_summary() -> None:
+    fallback = pytest.importorskip("app.pnl_native._numba_fallback")
+    trades = [
+        pnl.TradeSnapshot(timestamp=_ts(2025, 9, 5), side=OrderSide.BUY, price=Decimal("700"), size=Decimal("1.5"), post_only=True),
+        pnl.TradeSnapshot(timestamp=_ts(2025, 9, 5, 4), side=OrderSide.SELL, price=Decimal("900"), size=Decimal("2"), post_only=False),
+        pnl.TradeSnapshot(timestamp=_ts(2025, 12, 28), side=OrderSide.BUY, price=Decimal("800"), size=Decimal("0.25"), post_only=False),
+        pnl.TradeSnapshot(timestamp=_ts(2026, 1, 1, 3), side=OrderSide.BUY, price=Decimal("1200"), size=Decimal("1"), post_only=False),
+    ]
+    now = _ts(2026, 1, 2)
+
+    payload = fallback.summarise_trades(
+        [pnl._trade_to_native(trade) for trade in trades],
+        list(pnl._native_interval_specs()),
+        now_timestamp_us=pnl._to_microseconds(now),
+        cutoff_timestamp_us=pnl._to_microseconds(pnl.CUTOFF_TS),
+        maker_fee_rate=str(pnl.MAKER_FEE_RATE),
+        taker_fee_rate=str(pnl.TAKER_FEE_RATE),
+    )
+    jitted = pnl.summary_from_json(payload)
+    expected = pnl._summarise_trades_python(trades, now=now)
+
+    assert jitted == expected
+
+
+@pytest.mark.parametrize(
+    ("price_step", "size_step"),
+    [
+        pytest.param(Decimal("0.1"), Decimal("0.1"), id="tenths"),
+        pytest.param(Decimal("0.00000001"), Decimal("0.00000001"), id="full_8dp_precision"),
+    ],
+)
+def test_numba_fallback_is_exact_over_long_sequences(price_step: Decimal, size_step: Decimal) -> None:
+    fallback = pytest.importorskip("app.pnl_native._numba_fallback")
+    rng = random.Random(7)
+    start = _ts(2025, 9, 2)
+    trades = [
+        pnl.TradeSnapshot(
+            timestamp=start + timedelta(hours=2 * index),
+            side=rng.choice((OrderSide.BUY, OrderSide.SELL)),
+            price=Decimal("1500") + rng.randint(0, 10_000_000) * price_step,
+            size=rng.randint(1, 30) * Decimal("0.1") + rng.randint(0, 9) * size_step,
+            post_only=rng.random() < 0.5,
+        )
+        for index in range(3_000)
+    ]
+    now = trades[-1].timestamp + timedelta(hours=1)
+
+    payload = fallback.summarise_trades(
+        [pnl._trade_to_native(trade) for trade in trades],
+        list(pnl._native_interval_specs()),
+        now_timestamp_us=pnl._to_microseconds(now),
+        cutoff_timestamp_us=pnl._to_microseconds(pnl.CUTOFF_TS),
+        maker_fee_rate=str(pnl.MAKER_FEE_RATE),
+        taker_fee_rate=str(pnl.TAKER_FEE_RATE),
+    )
+
+    assert pnl.summary_from_json(payload) == pnl._summarise_trades_python(trades, now=now)
+
+
+def test_failing_numba_fallback_falls_back_to_python(monkeypatch: pytest.MonkeyPatch) -> None:
+    from app import pnl_native
+
+    def _broken_jit(*args, **kwargs):
+        raise RuntimeError("numba compilation failed")
+
+    monkeypatch.setattr(pnl_native, "_summarise_trades", None)
+    monkeypatch.setattr(pnl_native, "_summarise_trades_jit", _broken_jit)
+    now = _ts(2025, 9, 20)
+    trades = [
+        pnl.TradeSnapshot(
+            timestamp=_ts(2025, 9, 10), side=OrderSide.BUY, price=Decimal("1000"), size=Decimal("1"), post_only=True
+        ),
+        pnl.TradeSnapshot(
+            timestamp=_ts(2025, 9, 11), side=OrderSide.SELL, price=Decimal("1100"), size=Decimal("1"), post_only=False
+        ),
+    ]
+
+    assert pnl.summarise_trades(trades, now=now) == pnl._summarise_trades_python(trades, now=now)
+    assert pnl_native._summarise_trades_jit is None
@@ -5,7 +5,9 @@ from types import SimpleNamespace
 from app.dashboard.security import _is_authenticated
 
 
-password_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
+# Few rounds keep verify() cheap; the rounds are encoded in the hash, so the app honours them.
+password_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto", pbkdf2_sha256__rounds=1000)
+_SECRET_HASH = password_context.hash("secret")
 
 
 def _build_settings(**overrides: object):
@@ -13,7 +15,7 @@ def _build_settings(**overrides: object):
         "llm_stub_mode": True,
         "dashboard_basic_auth_enabled": True,
         "dashboard_basic_username": "user",
-        "dashboard_basic_password_hash": password_context.hash("secret"),
+        "dashboard_basic_password_hash": _SECRET_HASH,
     }
     base.update(overrides)
     return SimpleNamespace(**base)
@@ -1,11 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
 
 from app.coinbase.exec import ExecutionService, OrderType, PlannedOrder, resolve_submitted_time
 from app.coinbase.validators import ProductConstraints
@@ -13,12 +12,16 @@ from app.db import crud, models
 from app.db.models import OrderSide, OrderStatus
 
 
+# Validation only needs an end time comfortably in the future; a fixed one keeps runs reproducible.
+END_TIME = datetime(2030, 1, 1, tzinfo=timezone.utc)
+
+
 class DummyClient:
     async def create_order(self, payload):  # pragma: no cover - unused in tests
         return payload
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def constraints() -> ProductConstraints:
     return ProductConstraints(
         price_increment=Decimal("0.01"),
@@ -28,18 +31,17 @@ def constraints() -> ProductConstraints:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def execution_service(constraints: ProductConstraints) -> ExecutionService:
     return ExecutionService(DummyClient(), product_id="ETH-USDC", constraints=constraints)
 
 
 def test_validate_limit_order(execution_service: ExecutionService) -> None:
-    end_time = datetime.now(timezone.utc) + timedelta(hours=2)
     order = PlannedOrder(
         side=OrderSide.BUY,
         limit_price=Decimal("1979.991"),
         base_size=Decimal("0.05"),
-        end_time=end_time,
+        end_time=END_TIME,
         post_only=True,
     )
 
@@ -51,12 +53,11 @@ def test_validate_limit_order(execution_service: ExecutionService) -> None:
 
 
 def test_validate_stop_limit_order(execution_service: ExecutionService) -> None:
-    end_time = datetime.now(timezone.utc) + timedelta(hours=2)
     order = PlannedOrder(
         side=OrderSide.BUY,
         limit_price=Decimal("2060"),
         base_size=Decimal("0.05"),
-        end_time=end_time,
+        end_time=END_TIME,
         post_only=False,
         stop_price=Decimal("2050.001"),
         order_type=OrderType.STOP_LIMIT,
@@ -70,12 +71,11 @@ def test_validate_stop_limit_order(execution_service: ExecutionService) -> None:
 
 
 def test_validate_stop_limit_enforces_direction(execution_service: ExecutionService) -> None:
-    end_time = datetime.now(timezone.utc) + timedelta(hours=2)
     order = PlannedOrder(
         side=OrderSide.BUY,
         limit_price=Decimal("1995"),
         base_size=Decimal("0.05"),
-        end_time=end_time,
+        end_time=END_TIME,
         stop_price=Decimal("1980"),
         order_type=OrderType.STOP_LIMIT,
     )
@@ -85,12 +85,11 @@ def test_validate_stop_limit_enforces_direction(execution_service: ExecutionServ
 
 
 def test_stop_limit_payload_build(execution_service: ExecutionService) -> None:
-    end_time = datetime.now(timezone.utc) + timedelta(hours=2)
     order = PlannedOrder(
         side=OrderSide.SELL,
         limit_price=Decimal("1950"),
         base_size=Decimal("0.1"),
-        end_time=end_time,
+        end_time=END_TIME,
         post_only=False,
         stop_price=Decimal("1980"),
         order_type=OrderType.STOP_LIMIT,
@@ -104,12 +103,11 @@ def test_stop_limit_payload_build(execution_service: ExecutionService) -> None:
 
 
 def test_market_order_validation_and_payload(execution_service: ExecutionService) -> None:
-    end_time = datetime.now(timezone.utc) + timedelta(hours=2)
     order = PlannedOrder(
         side=OrderSide.BUY,
         limit_price=Decimal("2000"),
         base_size=Decimal("0.05"),
-        end_time=end_time,
+        end_time=END_TIME,
         post_only=False,
         stop_price=None,
         order_type=OrderType.MARKET,
@@ -127,12 +125,11 @@ def test_market_order_validation_and_payload(execution_service: ExecutionService
 
 
 def test_trigger_bracket_validation(execution_service: ExecutionService) -> None:
-    end_time = datetime.now(timezone.utc) + timedelta(hours=2)
     order = PlannedOrder(
         side=OrderSide.SELL,
         limit_price=Decimal("2100"),
         base_size=Decimal("0.05"),
-        end_time=end_time,
+        end_time=END_TIME,
         post_only=False,
         stop_price=Decimal("1900"),
         order_type=OrderType.TRIGGER_BRACKET,
@@ -146,12 +143,11 @@ def test_trigger_bracket_validation(execution_service: ExecutionService) -> None
 
 
 def test_trigger_bracket_requires_sell_side(execution_service: ExecutionService) -> None:
-    end_time = datetime.now(timezone.utc) + timedelta(hours=2)
     order = PlannedOrder(
         side=OrderSide.BUY,
         limit_price=Decimal("2100"),
         base_size=Decimal("0.05"),
-        end_time=end_time,
+        end_time=END_TIME,
         stop_price=Decimal("1900"),
         order_type=OrderType.TRIGGER_BRACKET,
     )
@@ -161,12 +157,11 @@ def test_trigger_bracket_requires_sell_side(execution_service: ExecutionService)
 
 
 def test_trigger_bracket_payload_build(execution_service: ExecutionService) -> None:
-    end_time = datetime.now(timezone.utc) + timedelta(hours=2)
     order = PlannedOrder(
         side=OrderSide.SELL,
         limit_price=Decimal("2100"),
         base_size=Decimal("0.05"),
-        end_time=end_time,
+        end_time=END_TIME,
         stop_price=Decimal("1900"),
         order_type=OrderType.TRIGGER_BRACKET,
     )
@@ -244,51 +239,71 @@ def test_resolve_submitted_time_marks_generated_timestamp(monkeypatch) -> None:
     assert inferred is True
 
 
-def test_upsert_executed_orders_skips_inferred_submitted_update() -> None:
-    engine = create_engine("sqlite:///:memory:", future=True)
-    models.Base.metadata.create_all(engine)
-    Session = sessionmaker(bind=engine, future=True)
-
+def test_upsert_executed_orders_skips_inferred_submitted_update(db_session) -> None:
     original_ts = datetime(2024, 7, 5, 12, 0, tzinfo=timezone.utc)
-    with Session() as session:
-        order = models.ExecutedOrder(
-            order_id="order-1",
-            ts_submitted=original_ts,
-            ts_filled=None,
-            side=OrderSide.BUY,
-            limit_price=Decimal("1000"),
-            base_size=Decimal("0.5"),
-            status=OrderStatus.FILLED,
-            filled_size=Decimal("0.5"),
-            client_order_id="client-1",
-            end_time=original_ts + timedelta(hours=1),
-            product_id="ETH-USDC",
-            stop_price=None,
-        )
-        session.add(order)
-        session.commit()
-
-        record = crud.ExecutedOrderRecord(
-            order_id="order-1",
-            ts_submitted=original_ts + timedelta(minutes=5),
-            ts_filled=None,
-            side=OrderSide.BUY,
-            limit_price=Decimal("1000"),
-            base_size=Decimal("0.5"),
-            status=OrderStatus.FILLED,
-            filled_size=Decimal("0.5"),
-            client_order_id="client-1",
-            end_time=original_ts + timedelta(hours=1),
-            product_id="ETH-USDC",
-            stop_price=None,
-            ts_submitted_inferred=True,
-        )
-
-        crud.upsert_executed_orders(session, [record])
-
-        refreshed = session.get(models.ExecutedOrder, "order-1")
-        assert refreshed is not None
-        assert refreshed.ts_submitted == (original_ts.replace(tzinfo=None))
-        assert refreshed.ts_submitted != (original_ts + timedelta(minutes=5)).replace(tzinfo=None)
-
-    engine.dispose()
+    order = models.ExecutedOrder(
+        order_id="order-1",
+        ts_submitted=original_ts,
+        ts_filled=None,
+        side=OrderSide.BUY,
+        limit_price=Decimal("1000"),
+        base_size=Decimal("0.5"),
+        status=OrderStatus.FILLED,
+        filled_size=Decimal("0.5"),
+        client_order_id="client-1",
+        end_time=original_ts + timedelta(hours=1),
+        product_id="ETH-USDC",
+        stop_price=None,
+    )
+    db_session.add(order)
+    db_session.commit()
+
+    record = crud.ExecutedOrderRecord(
+        order_id="order-1",
+        ts_submitted=original_ts + timedelta(minutes=5),
+        ts_filled=None,
+        side=OrderSide.BUY,
+        limit_price=Decimal("1000"),
+        base_size=Decimal("0.5"),
+        status=OrderStatus.FILLED,
+        filled_size=Decimal("0.5"),
+        client_order_id="client-1",
+        end_time=original_ts + timedelta(hours=1),
+        product_id="ETH-USDC",
+        stop_price=None,
+        ts_submitted_inferred=True,
+    )
+
+    crud.upsert_executed_orders(db_session, [record])
+
+    refreshed = db_session.get(models.ExecutedOrder, "order-1")
+    assert refreshed is not None
+    assert refreshed.ts_submitted == (original_ts.replace(tzinfo=None))
+    assert refreshed.ts_submitted != (original_ts + timedelta(minutes=5)).replace(tzinfo=None)
+
+
+def test_fetch_open_and_fills_reads_the_exchange_before_any_session_is_used(db_session, constraints) -> None:
+    class SyncClient:
+        async def list_orders(self, **kwargs):
+            return [
+                {
+                    "order_id": "open-1",
+                    "client_order_id": "client-1",
+                    "product_id": "ETH-USDC",
+                    "side": "BUY",
+                    "status": "OPEN",
+                    "created_time": "2025-01-01T00:00:00Z",
+                    "order_configuration": {"limit_limit_gtc": {"base_size": "0.05", "limit_price": "1900"}},
+                }
+            ]
+
+        async def list_fills(self, **kwargs):
+            return []
+
+    service = ExecutionService(SyncClient(), product_id="ETH-USDC", constraints=constraints)
+
+    open_records, executed_records = asyncio.run(service.fetch_open_and_fills())
+    result = service.store_open_and_fills(db_session, open_records, executed_records)
+
+    assert [record.order_id for record in result.open_orders] == ["open-1"]
+    assert db_session.query(models.OpenOrder).one().limit_price == Decimal("1900")
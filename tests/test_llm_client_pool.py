@@ -0,0 +1,21 @@
+import asyncio
+from types import SimpleNamespace
+
+from app.llm.client import LLMClientPool
+from app.llm.usage import UsageTracker
+
+
+def test_pool_reuses_idle_client_and_swaps_usage_tracker() -> None:
+    async def scenario() -> None:
+        pool = LLMClientPool(settings=SimpleNamespace(openai_api_key="sk-test", llm_stub_mode=True), size=1)
+        first_usage, second_usage = UsageTracker(), UsageTracker()
+
+        async with pool.acquire(usage_tracker=first_usage) as first:
+            assert first.usage is first_usage
+        async with pool.acquire(usage_tracker=second_usage) as second:
+            assert second is first
+            assert second.usage is second_usage
+
+        await pool.close()
+
+    asyncio.run(scenario())
@@ -1,10 +1,14 @@
+import asyncio
 from decimal import Decimal
+from types import SimpleNamespace
 
 import pytest
 from pydantic import ValidationError
 
 from app.coinbase.exec import OrderType
 from app.db.models import OrderSide
+from app.llm.client import LLMClient
+from app.llm.prompts import Model3Context
 from app.llm.schemas import Model3Order, Model3Response
 
 
@@ -178,3 +182,42 @@ def test_model3_trigger_bracket_requires_stop_price() -> None:
                 "order_type": "trigger_bracket",
             }
         )
+
+
+def _model3_client(response: object) -> LLMClient:
+    settings = SimpleNamespace(
+        openai_api_key="sk-test",
+        llm_stub_mode=False,
+        openai_responses_model_m3="gpt-5",
+        openai_responses_reasoning_m3="low",
+    )
+    client = LLMClient(settings=settings)
+
+    async def create(**kwargs):
+        return response
+
+    client._client = SimpleNamespace(responses=SimpleNamespace(create=create))
+    return client
+
+
+def _model3_context() -> Model3Context:
+    return Model3Context(model2_output="", validation_notes="")
+
+
+def test_run_model3_skips_malformed_json_part() -> None:
+    valid = '{"orders": [{"side": "BUY", "limit_price": "1900", "base_size": "0.05"}], "warnings": null}'
+    client = _model3_client({"output": [{"content": [{"json": '{"orders": ['}, {"json": valid}]}]})
+
+    response = asyncio.run(client.run_model3(_model3_context()))
+
+    assert [order.limit_price for order in response.orders] == [Decimal("1900")]
+
+
+def test_run_model3_falls_back_to_output_text_when_json_parts_are_malformed() -> None:
+    client = _model3_client(
+        SimpleNamespace(output=[{"content": [{"json": '{"orders": ['}]}], output_text='{"orders": []}')
+    )
+
+    response = asyncio.run(client.run_model3(_model3_context()))
+
+    assert response.orders == []
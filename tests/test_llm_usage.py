@@ -0,0 +1,94 @@
+from types import SimpleNamespace
+
+import pytest
+from pydantic import BaseModel
+
+from app.llm.client import LLMClient
+from app.llm.usage import UsageRecord, UsageTracker
+
+
+class _Usage(BaseModel):
+    input_tokens: int
+    output_tokens: int
+    total_tokens: int
+
+
+class _Response(BaseModel):
+    model: str
+    usage: _Usage
+
+
+def _response(model: str, input_tokens: int, output_tokens: int) -> dict:
+    return {
+        "model": model,
+        "usage": {
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+        },
+    }
+
+
+def test_totals_track_added_responses() -> None:
+    tracker = UsageTracker()
+    tracker.add_response(_response("gpt-5", 10, 5))
+    tracker.add_response(_response("gpt-5-mini", 3, 2))
+
+    assert tracker.totals() == {
+        "input_tokens": 13,
+        "output_tokens": 7,
+        "total_tokens": 20,
+        "requests": 2,
+    }
+
+
+def test_add_response_accepts_pydantic_models() -> None:
+    tracker = UsageTracker()
+    tracker.add_response(
+        _Response(model="gpt-5", usage=_Usage(input_tokens=7, output_tokens=3, total_tokens=10))
+    )
+
+    assert tracker.to_json() == [
+        {"model": "gpt-5", "input_tokens": 7, "output_tokens": 3, "total_tokens": 10}
+    ]
+
+
+def test_totals_skip_responses_without_usage() -> None:
+    tracker = UsageTracker()
+    tracker.add_response({"stub": True})
+
+    assert tracker.totals()["requests"] == 0
+    assert tracker.to_json() == []
+
+
+def test_merge_combines_totals() -> None:
+    first = UsageTracker()
+    first.add_response(_response("gpt-5", 10, 5))
+    second = UsageTracker(records=[UsageRecord(model="gpt-5-mini", input_tokens=4, output_tokens=1, total_tokens=5)])
+
+    first.merge(second)
+
+    assert first.totals() == {
+        "input_tokens": 14,
+        "output_tokens": 6,
+        "total_tokens": 20,
+        "requests": 2,
+    }
+    assert [record["model"] for record in first.to_json()] == ["gpt-5", "gpt-5-mini"]
+
+
+def test_llm_client_keeps_empty_usage_tracker() -> None:
+    tracker = UsageTracker()
+
+    client = LLMClient(settings=SimpleNamespace(openai_api_key="sk-test", llm_stub_mode=True), usage_tracker=tracker)
+
+    assert client.usage is tracker
+
+
+def test_records_is_a_read_only_snapshot() -> None:
+    tracker = UsageTracker()
+    tracker.add_response(_response("gpt-5", 10, 5))
+
+    assert tracker.records == (UsageRecord(model="gpt-5", input_tokens=10, output_tokens=5, total_tokens=15),)
+    with pytest.raises(AttributeError):
+        tracker.records.append(UsageRecord(model="gpt-5", input_tokens=1, output_tokens=1, total_tokens=2))
@@ -1,4 +1,7 @@
-from app.logging import _normalise_level
+import json
+from decimal import Decimal
+
+from app.logging import _normalise_level, json_dumps
 
 
 def test_normalise_level_lowercase() -> None:
@@ -15,3 +18,10 @@ def test_normalise_level_numeric_passthrough() -> None:
 
 def test_normalise_level_empty_defaults() -> None:
     assert _normalise_level("") == "INFO"
+
+
+def test_json_dumps_is_compact_and_stringifies_unknown_types() -> None:
+    payload = json.loads(json_dumps({"price": Decimal("2015.50"), "count": 2}))
+
+    assert payload == {"price": "2015.50", "count": 2}
+    assert " " not in json_dumps({"a": 1, "b": [1, 2]})
@@ -0,0 +1,18 @@
+from fastapi.testclient import TestClient
+
+from app import main
+from app.config import Settings
+
+
+def test_app_starts_without_coinbase_credentials(monkeypatch, tmp_path) -> None:
+    settings = Settings(
+        LLM_STUB_MODE=True,
+        COINBASE_API_KEY=None,
+        COINBASE_API_SECRET=None,
+        DATABASE_URL=f"sqlite:///{tmp_path / 'app.db'}",
+    )
+    monkeypatch.setattr(main, "get_settings", lambda: settings)
+
+    with TestClient(main.app) as client:
+        assert client.get("/health").json() == {"status": "ok"}
+        assert client.app.state.orchestrator._cb_client is None
@@ -1,15 +1,22 @@
 import math
 
-import pandas as pd
-
 from app.coinbase.market import calculate_ema, calculate_rsi
 
 
-def test_calculate_ema_matches_pandas() -> None:
+def _ema_reference(values: list[float], period: int) -> float:
+    # The unadjusted recurrence pandas' ewm(span=period, adjust=False) computes.
+    alpha = 2 / (period + 1)
+    ema = values[0]
+    for value in values[1:]:
+        ema = alpha * value + (1 - alpha) * ema
+    return ema
+
+
+def test_calculate_ema_matches_recurrence() -> None:
     values = [float(i) for i in range(1, 21)]
     period = 5
     ema = calculate_ema(values, period)
-    expected = pd.Series(values).ewm(span=period, adjust=False).mean().iloc[-1]
+    expected = _ema_reference(values, period)
     assert ema is not None
     assert math.isclose(ema, expected, rel_tol=1e-9)
 
@@ -0,0 +1,16 @@
+from decimal import Decimal
+from types import SimpleNamespace
+
+from app.scheduler.orchestration import SchedulerOrchestrator
+
+
+def test_check_price_drift_compares_relative_move_to_threshold() -> None:
+    orchestrator = SchedulerOrchestrator(
+        settings=SimpleNamespace(product_id="ETH-USDC", price_drift_pct=Decimal("0.005"))
+    )
+    start = Decimal("2000")
+
+    assert orchestrator._check_price_drift(start, Decimal("2009.99"))
+    assert orchestrator._check_price_drift(start, Decimal("1990.01"))
+    assert not orchestrator._check_price_drift(start, Decimal("2010"))
+    assert not orchestrator._check_price_drift(start, Decimal("1990"))
@@ -14,6 +14,7 @@ CONSTRAINTS = ProductConstraints(
     min_size=Decimal("0.001"),
     min_distance_pct=Decimal("0.001"),
 )
+END_TIME = datetime(2030, 1, 1, tzinfo=timezone.utc)
 
 
 def _planned_order(*, side: OrderSide, limit_price: Decimal, base_size: Decimal, post_only: bool, order_type: OrderType) -> PlannedOrder:
@@ -21,7 +22,7 @@ def _planned_order(*, side: OrderSide, limit_price: Decimal, base_size: Decimal,
         side=side,
         limit_price=limit_price,
         base_size=base_size,
-        end_time=datetime.now(timezone.utc),
+        end_time=END_TIME,
         post_only=post_only,
         order_type=order_type,
     )
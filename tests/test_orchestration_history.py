@@ -0,0 +1,33 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from app.db import RunKind
+from app.scheduler import orchestration
+from app.scheduler.orchestration import SchedulerOrchestrator
+
+
+def test_prompt_history_entry_joins_lines_and_truncates() -> None:
+    orchestrator = SchedulerOrchestrator(settings=SimpleNamespace(product_id="ETH-USDC"))
+    ts = datetime(2025, 9, 1, tzinfo=timezone.utc)
+    text = "\n  first line\n" + "\n".join("x" * 90 for _ in range(20)) + "\n"
+
+    entry = orchestrator._format_prompt_history_entry(ts, text)
+
+    prefix = f"{ts.isoformat()}Z :: "
+    assert entry.startswith(prefix + "first line " + "x" * 90 + " ")
+    assert len(entry) == len(prefix) + 500
+
+
+def test_history_entries_are_cached_by_row_id() -> None:
+    orchestrator = SchedulerOrchestrator(settings=SimpleNamespace(product_id="ETH-USDC"))
+    ts = datetime(2025, 9, 1, tzinfo=timezone.utc)
+    row = SimpleNamespace(id=1, ts=ts, compact_summary_500w=None, response_text="first")
+
+    assert orchestrator._history_entry(RunKind.ORDER, row) == f"{ts.isoformat()}Z :: first"
+    row.response_text = "changed"
+    assert orchestrator._history_entry(RunKind.ORDER, row) == f"{ts.isoformat()}Z :: first"
+
+    for row_id in range(2, 2 + orchestration.HISTORY_ENTRY_CACHE_SIZE):
+        orchestrator._history_entry(RunKind.ORDER, SimpleNamespace(id=row_id, ts=ts, compact_summary_500w="x", response_text=""))
+    assert len(orchestrator._history_entries) == orchestration.HISTORY_ENTRY_CACHE_SIZE
+    assert (RunKind.ORDER, 1) not in orchestrator._history_entries
@@ -0,0 +1,83 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.scheduler import orchestration
+from app.scheduler.orchestration import SchedulerOrchestrator
+
+
+def test_monitor_skips_while_planning_lock_is_held() -> None:
+    async def scenario() -> None:
+        # SimpleNamespace settings would fail any DB or Coinbase access, so returning proves the skip.
+        orchestrator = SchedulerOrchestrator(settings=SimpleNamespace(product_id="ETH-USDC"))
+        async with orchestrator._planning_lock:
+            await orchestrator.run_monitor()
+
+    asyncio.run(scenario())
+
+
+def test_market_followup_task_is_tracked_until_it_runs(monkeypatch) -> None:
+    monkeypatch.setattr(orchestration, "MARKET_FOLLOW_UP_DELAY_SECONDS", 0)
+    calls: list[str] = []
+
+    async def scenario() -> None:
+        orchestrator = SchedulerOrchestrator(settings=SimpleNamespace(product_id="ETH-USDC"))
+
+        async def fake_run_order(*, triggered_by: str) -> None:
+            calls.append(triggered_by)
+
+        orchestrator.run_order = fake_run_order
+        orchestrator._schedule_market_followup(triggered_by="market_followup")
+        assert len(orchestrator._pending_tasks) == 1
+        await asyncio.gather(*orchestrator._pending_tasks)
+        assert not orchestrator._pending_tasks
+
+    asyncio.run(scenario())
+    assert calls == ["market_followup"]
+
+
+def test_background_snapshot_writes_are_drained() -> None:
+    written: list[str] = []
+
+    async def scenario() -> None:
+        orchestrator = SchedulerOrchestrator(settings=SimpleNamespace(product_id="ETH-USDC"))
+
+        async def fake_record(snapshot, *, ts=None) -> None:
+            await asyncio.sleep(0)
+            if snapshot == "bad":
+                raise RuntimeError("db down")
+            written.append(snapshot)
+
+        orchestrator._record_price_snapshot = fake_record
+        orchestrator._record_price_snapshot_in_background("ok")
+        orchestrator._record_price_snapshot_in_background("bad")
+        # Failures are logged rather than raised into the run.
+        await orchestrator._drain_background_writes()
+        assert not orchestrator._background_writes
+
+    asyncio.run(scenario())
+    assert written == ["ok"]
+
+
+def test_startup_without_coinbase_credentials_leaves_runs_to_fail() -> None:
+    settings = SimpleNamespace(product_id="ETH-USDC", coinbase_api_key=None, coinbase_api_secret=None)
+
+    async def scenario() -> None:
+        orchestrator = SchedulerOrchestrator(settings=settings)
+        await orchestrator.startup()
+        with pytest.raises(RuntimeError, match="credentials are not configured"):
+            orchestrator.coinbase
+        await orchestrator.shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_coinbase_client_is_unavailable_after_shutdown() -> None:
+    async def scenario() -> None:
+        orchestrator = SchedulerOrchestrator(settings=SimpleNamespace(product_id="ETH-USDC"))
+        await orchestrator.shutdown()
+        with pytest.raises(RuntimeError, match="not open"):
+            orchestrator.coinbase
+
+    asyncio.run(scenario())
@@ -0,0 +1,33 @@
+import asyncio
+from types import SimpleNamespace
+
+from fastapi import FastAPI
+
+from app.scheduler import jobs
+
+
+def test_scheduled_jobs_and_force_routes_share_module_level_callables(monkeypatch) -> None:
+    calls: list[str] = []
+
+    class FakeOrchestrator:
+        async def run_plan(self) -> None:
+            calls.append("plan")
+
+        async def run_pnl(self) -> None:
+            calls.append("pnl")
+
+    added: list[tuple] = []
+    scheduler = SimpleNamespace(add_job=lambda func, **kwargs: added.append((func, kwargs)))
+    app = FastAPI()
+    app.state.orchestrator = FakeOrchestrator()
+    monkeypatch.setattr(jobs, "_orchestrator", None)
+
+    jobs.register_jobs(scheduler, app)
+
+    # Plain module functions with no bound args, so a persistent job store can serialise them.
+    assert [func for func, _ in added] == [jobs.plan_job, jobs.monitor_job, jobs.pnl_job]
+    assert all("args" not in kwargs and "kwargs" not in kwargs for _, kwargs in added)
+
+    asyncio.run(jobs.force_plan())
+    asyncio.run(jobs.force_pnl())
+    assert calls == ["plan", "pnl"]
@@ -32,6 +32,16 @@ def test_round_price_sell_rounds_up() -> None:
     assert rounded == Decimal("2015.68")
 
 
+@pytest.mark.parametrize("side", [OrderSide.BUY, OrderSide.SELL])
+def test_round_price_matches_integer_oracle(side: OrderSide) -> None:
+    # Prices in thousandths of a unit; the oracle floors (BUY) or ceils (SELL) to whole cents.
+    for millis in range(1_000_000, 3_000_000, 1_379):
+        rounded = round_price(Decimal(millis).scaleb(-3), CONSTRAINTS, side)
+        expected_cents = millis // 10 if side is OrderSide.BUY else -(-millis // 10)
+        assert rounded * 100 == expected_cents, millis
+        assert rounded.as_tuple().exponent == -2
+
+
 def test_round_size_applies_increment() -> None:
     size = Decimal("0.1234")
     rounded = round_size(size, CONSTRAINTS)